@@ -0,0 +1,180 @@
+"""Compare the columnar models against the former pydantic models.
+
+Parses the same fixtures with both and reports the median parse time and
+the memory retained by the parsed response. The pydantic models are
+reproduced below as they were before the columnar rewrite, reduced to the
+parts involved in parsing, so the comparison runs on any commit.
+
+Needs pydantic (see requirements.txt) but not Home Assistant:
+
+    python benchmarks/compare_models.py [--countries de] [--iterations 20]
+
+The fixtures have to be recorded first (see record_fixtures.py); pass
+--synthetic to run on synthetic payloads instead.
+"""
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import gc
+import importlib.util
+import json
+from pathlib import Path
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from pydantic import BaseModel, Field, field_validator
+
+from fixtures import COUNTRIES, KINDS, FixtureMissingError, load_fixture
+
+MODELS_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "energy_charts"
+    / "models.py"
+)
+
+
+class ReferenceSeries(BaseModel):
+    """Series model of the integration before the columnar rewrite."""
+
+    name: dict[str, str] = Field(...)
+    color: str = Field(...)
+    data: list[float | None] = Field(default_factory=list)
+    timestamps: list[int] = Field(default_factory=list)
+    visible: bool = Field(default=True)
+
+    @field_validator("name", mode="before")
+    @classmethod
+    def normalize_name(cls, v: dict | list) -> dict:
+        """Normalize the name to a dict."""
+        if isinstance(v, list) and len(v) > 0:
+            return v[0]
+        if isinstance(v, dict):
+            return v
+        return {}
+
+
+class ReferenceResponse(BaseModel):
+    """Response model of the integration before the columnar rewrite."""
+
+    data_series: list[ReferenceSeries] = Field(default_factory=list)
+
+    @classmethod
+    def from_api_response(cls, response_data: list[dict[str, Any]]) -> ReferenceResponse:
+        """Create an instance from the raw API response."""
+        if not response_data:
+            return cls(data_series=[])
+        timestamps = response_data[0].get("xAxisValues", [])
+        return cls(
+            data_series=[
+                ReferenceSeries(
+                    name=item["name"],
+                    color=item.get("color", "#000000"),
+                    data=item.get("data", []),
+                    timestamps=timestamps,
+                    visible=item.get("visible", True),
+                )
+                for item in response_data
+                if "name" in item and "data" in item
+            ]
+        )
+
+
+def _load_columnar() -> Any:
+    """Import the integration's models module without the package."""
+    spec = importlib.util.spec_from_file_location("energy_charts_models", MODELS_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _median_ms(call: Callable[[], Any], iterations: int) -> float:
+    """Return the median latency of a call in milliseconds."""
+    call()  # warm up
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def _retained_kib(call: Callable[[], Any]) -> float:
+    """Return the memory retained by the result of a call in KiB."""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = call()
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return (after - before) / 1024
+
+
+def compare(countries: list[str], iterations: int, synthetic: bool) -> dict[str, Any]:
+    """Parse every fixture with both models and collect the measurements."""
+    columnar = _load_columnar().EnergyChartsResponse
+    results: dict[str, Any] = {}
+
+    for country in countries:
+        for kind in KINDS:
+            payload = load_fixture(country, KINDS[kind], synthetic)
+            raw = json.loads(payload)
+            result = {}
+            for model, parse in (
+                ("pydantic", ReferenceResponse.from_api_response),
+                ("columnar", columnar.from_api_response),
+            ):
+                result[model] = {
+                    "parse_ms": round(_median_ms(lambda: parse(raw), iterations), 3),
+                    "retained_kib": round(_retained_kib(lambda: parse(raw)), 1),
+                }
+            results[f"{country}/{kind}"] = result
+
+    return results
+
+
+def main() -> None:
+    """Parse arguments, run the comparison and print a table."""
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--countries", nargs="+", default=list(COUNTRIES))
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--output", type=Path, help="write results to this file")
+    parser.add_argument(
+        "--synthetic",
+        action="store_true",
+        help="parse synthetic payloads instead of the recorded fixtures",
+    )
+    args = parser.parse_args()
+
+    try:
+        results = compare(args.countries, args.iterations, args.synthetic)
+    except FixtureMissingError as err:
+        parser.error(str(err))
+
+    print(
+        f"{'fixture':12} {'pydantic ms':>12} {'columnar ms':>12} "
+        f"{'pydantic KiB':>13} {'columnar KiB':>13}"
+    )
+    for name, result in results.items():
+        pyd, col = result["pydantic"], result["columnar"]
+        print(
+            f"{name:12} {pyd['parse_ms']:12.3f} {col['parse_ms']:12.3f} "
+            f"{pyd['retained_kib']:13.1f} {col['retained_kib']:13.1f}"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
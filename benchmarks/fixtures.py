@@ -0,0 +1,151 @@
+"""Energy-Charts payload fixtures for the benchmarks.
+
+The benchmarks run at a pinned moment, PINNED_NOW, so every commit requests
+the same endpoint files: the week file of that moment, the week before it
+and the month file. All of them are closed, so their content no longer
+changes. Recorded payloads live in benchmarks/fixtures/<country>/<endpoint>
+and are created by record_fixtures.py, which also writes the SHA-256 of
+every file to fixtures/manifest.json.
+
+A missing recording is an error; runs only use deterministic synthetic
+payloads of the same shape when asked to, so synthetic numbers are never
+mistaken for measurements of real data.
+"""
+from __future__ import annotations
+
+import calendar
+from datetime import date, datetime, timezone
+import hashlib
+import json
+from pathlib import Path
+import random
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+MANIFEST_PATH = FIXTURES_DIR / "manifest.json"
+
+COUNTRIES = ("de", "at", "ch", "fr", "nl", "be", "pl", "cz")
+
+# Thursday of ISO week 11 of 2025, in local time like the integration
+PINNED_NOW = datetime(2025, 3, 13, 12, 0)
+
+# Fixture kinds, named after the historical range they are benchmarked
+# with, and the endpoint file standing for each
+KINDS = {"week": "week_2025_11.json", "month": "month_2025_03.json"}
+
+# Every endpoint file a refresh at PINNED_NOW requests
+ENDPOINTS = ("week_2025_10.json", "week_2025_11.json", "month_2025_03.json")
+
+QUARTER_HOUR_MS = 15 * 60 * 1000
+
+# Series of a public power file: (English name, German name, mean MW)
+_SERIES = (
+    ("Hydro pumped storage consumption", "Pumpspeicher Verbrauch", -1500.0),
+    ("Cross border electricity trading", "Grenzüberschreitender Stromhandel", 2000.0),
+    ("Nuclear", "Kernenergie", 4000.0),
+    ("Hydro Run-of-River", "Laufwasser", 1800.0),
+    ("Biomass", "Biomasse", 4500.0),
+    ("Fossil brown coal / lignite", "Braunkohle", 9000.0),
+    ("Fossil hard coal", "Steinkohle", 4000.0),
+    ("Fossil oil", "Öl", 300.0),
+    ("Fossil coal-derived gas", "Kohlegas", 400.0),
+    ("Fossil gas", "Erdgas", 6000.0),
+    ("Geothermal", "Geothermie", 20.0),
+    ("Hydro water reservoir", "Speicherwasser", 150.0),
+    ("Hydro pumped storage", "Pumpspeicher", 1200.0),
+    ("Others", "Andere", 200.0),
+    ("Waste", "Müll", 700.0),
+    ("Wind offshore", "Wind Offshore", 3000.0),
+    ("Wind onshore", "Wind Onshore", 12000.0),
+    ("Solar", "Solar", 8000.0),
+    ("Load", "Last", 55000.0),
+    ("Residual load", "Residuallast", 35000.0),
+    ("Renewable share of generation", "Anteil EE an der Erzeugung", 55.0),
+    ("Renewable share of load", "Anteil EE an der Last", 50.0),
+    ("Solar (planned)", "Solar (geplant)", 8000.0),
+    ("Wind onshore (planned)", "Wind Onshore (geplant)", 12000.0),
+    ("Wind offshore (planned)", "Wind Offshore (geplant)", 3000.0),
+)
+
+
+class FixtureMissingError(FileNotFoundError):
+    """A fixture has not been recorded."""
+
+
+def fixture_path(country: str, endpoint: str) -> Path:
+    """Return the path of the recorded fixture of a country and endpoint."""
+    return FIXTURES_DIR / country / endpoint
+
+
+def _period(endpoint: str) -> tuple[date, int]:
+    """Return the first day and the number of days of an endpoint file."""
+    kind, year, number = endpoint.removesuffix(".json").split("_")
+    if kind == "week":
+        return date.fromisocalendar(int(year), int(number), 1), 7
+    days = calendar.monthrange(int(year), int(number))[1]
+    return date(int(year), int(number), 1), days
+
+
+def synthetic_payload(country: str, endpoint: str) -> bytes:
+    """Generate a deterministic payload shaped like an Energy-Charts file.
+
+    Args:
+        country: Country code, used to seed the generator
+        endpoint: Endpoint file name, e.g. "week_2025_11.json"
+
+    Returns:
+        JSON encoded payload covering the period of the endpoint
+
+    """
+    rng = random.Random(f"{country}-{endpoint}")
+    first_day, days = _period(endpoint)
+    start = int(
+        datetime.combine(first_day, datetime.min.time(), timezone.utc).timestamp()
+        * 1000
+    )
+    timestamps = [start + index * QUARTER_HOUR_MS for index in range(days * 96)]
+
+    items = []
+    for index, (name_en, name_de, mean) in enumerate(_SERIES):
+        data = [round(mean * (0.6 + 0.8 * rng.random()), 1) for _ in timestamps]
+        item = {
+            "name": [{"en": name_en, "de": name_de}],
+            "color": f"#{rng.randrange(0x1000000):06x}",
+            "data": data,
+        }
+        if index == 0:
+            item = {"xAxisValues": timestamps, **item}
+        items.append(item)
+
+    return json.dumps(items, ensure_ascii=False).encode()
+
+
+def load_fixture(country: str, endpoint: str, synthetic: bool = False) -> bytes:
+    """Return the payload of a country and endpoint.
+
+    Args:
+        country: Country code
+        endpoint: Endpoint file name, one of ENDPOINTS
+        synthetic: Use the synthetic payload instead of the recording
+
+    Returns:
+        JSON encoded payload
+
+    Raises:
+        FixtureMissingError: No recording exists and synthetic is False
+
+    """
+    if synthetic:
+        return synthetic_payload(country, endpoint)
+    path = fixture_path(country, endpoint)
+    if not path.exists():
+        raise FixtureMissingError(
+            f"No recorded fixture at {path}. Record the fixtures with "
+            "'python benchmarks/record_fixtures.py' (needs network access), "
+            "or pass --synthetic to run on synthetic payloads."
+        )
+    return path.read_bytes()
+
+
+def checksum(payload: bytes) -> str:
+    """Return the SHA-256 of a payload as recorded in the manifest."""
+    return hashlib.sha256(payload).hexdigest()
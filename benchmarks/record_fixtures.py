@@ -0,0 +1,62 @@
+"""Record Energy-Charts payloads as benchmark fixtures.
+
+Downloads the pinned endpoint files (see fixtures.ENDPOINTS) of every
+supported country into benchmarks/fixtures and writes their SHA-256 to
+fixtures/manifest.json. The files are closed, so recording them again
+yields the same payloads; the manifest shows if the server changed them.
+Run it once with network access and commit the result; the benchmarks then
+replay the recordings offline.
+
+    python benchmarks/record_fixtures.py [--countries de at]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+
+import aiohttp
+
+from fixtures import COUNTRIES, ENDPOINTS, MANIFEST_PATH, checksum, fixture_path
+
+API_BASE_URL = "https://www.energy-charts.info/charts/power/data"
+
+
+async def record(countries: list[str]) -> None:
+    """Download and store the fixtures of the given countries."""
+    manifest: dict[str, dict[str, str]] = (
+        json.loads(MANIFEST_PATH.read_text()) if MANIFEST_PATH.exists() else {}
+    )
+
+    async with aiohttp.ClientSession() as session:
+        for country in countries:
+            for endpoint in ENDPOINTS:
+                url = f"{API_BASE_URL}/{country}/{endpoint}"
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    body = await response.read()
+
+                path = fixture_path(country, endpoint)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(body)
+
+                digest = checksum(body)
+                previous = manifest.get(country, {}).get(endpoint)
+                if previous is not None and previous != digest:
+                    print(f"{country} {endpoint}: changed since the last recording")
+                manifest.setdefault(country, {})[endpoint] = digest
+                print(f"{country} {endpoint}: {len(body)} bytes, sha256 {digest[:12]}")
+
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+
+
+def main() -> None:
+    """Parse arguments and record the fixtures."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--countries", nargs="+", default=list(COUNTRIES))
+    args = parser.parse_args()
+    asyncio.run(record(args.countries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,431 @@
+"""Offline benchmarks of the Energy-Charts refresh pipeline.
+
+Replays the fixtures of every supported country through a local stand-in
+server, with the clock frozen at fixtures.PINNED_NOW so every commit
+requests the same closed endpoint files, and measures latency (median, p95,
+min over the iterations), peak traced memory and net allocated blocks of:
+
+    refresh                  Cold refresh of a new coordinator and client
+    revalidate               Refresh answered with 304 Not Modified
+    decode                   Streaming decode of the raw payload
+    from_api_response        Model construction from already parsed JSON
+    entity_update            State and attributes of every sensor of the
+                             entry after the coordinator got new data
+    entity_state             Same, with unchanged data
+    import/integration       Importing the integration package (fresh process)
+    import/runtime           Importing the modules loaded on entry setup
+
+Only entry points every commit has are used: the coordinator's
+async_refresh, sensor platform setup and the entity properties. A benchmark
+whose feature a commit lacks, such as the response cache of revalidate, is
+left out of that commit's results.
+
+Results are written as JSON together with the commit they were taken at
+and the checksums of the fixtures, so runs can be compared across commits:
+
+    python benchmarks/run.py --output before.json
+    python benchmarks/run.py --compare before.json
+
+The fixtures have to be recorded first (see record_fixtures.py); pass
+--synthetic to run on synthetic payloads instead.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+import inspect
+import json
+from pathlib import Path
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import aiohttp  # noqa: E402
+from freezegun import freeze_time  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.energy_charts import api, sensor  # noqa: E402
+from custom_components.energy_charts.api import EnergyChartsApiClient  # noqa: E402
+from custom_components.energy_charts.const import (  # noqa: E402
+    CONF_COUNTRY,
+    CONF_HISTORICAL_RANGE,
+    DOMAIN,
+)
+from custom_components.energy_charts.coordinator import (  # noqa: E402
+    EnergyChartsDataUpdateCoordinator,
+)
+from custom_components.energy_charts.models import EnergyChartsResponse  # noqa: E402
+from fixtures import (  # noqa: E402
+    COUNTRIES,
+    KINDS,
+    PINNED_NOW,
+    FixtureMissingError,
+    checksum,
+    load_fixture,
+)
+from server import FixtureServer  # noqa: E402
+
+# Modules of later commits; the benchmarks needing them are skipped without
+try:
+    from custom_components.energy_charts.cache import EnergyChartsResponseCache
+except ImportError:
+    EnergyChartsResponseCache = None
+try:
+    from custom_components.energy_charts.const import API_CHUNK_SIZE
+    from custom_components.energy_charts.decoder import EnergyChartsStreamDecoder
+except ImportError:
+    EnergyChartsStreamDecoder = None
+try:
+    from custom_components.energy_charts.store import EnergyChartsResponseStore
+except ImportError:
+    EnergyChartsResponseStore = None
+
+
+def _summary(timings_ms: list[float], peak_bytes: int, net_blocks: int) -> dict[str, Any]:
+    """Summarize the measurements of one benchmark."""
+    ordered = sorted(timings_ms)
+    return {
+        "median_ms": round(statistics.median(ordered), 4),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4),
+        "min_ms": round(ordered[0], 4),
+        "peak_kib": round(peak_bytes / 1024, 1),
+        "net_blocks": net_blocks,
+    }
+
+
+def _measure_memory(call: Callable[[], Any]) -> tuple[int, int]:
+    """Return peak traced bytes and net allocated blocks of one call."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    result = call()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+    net_blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return peak, net_blocks
+
+
+def bench(call: Callable[[], Any], iterations: int) -> dict[str, Any]:
+    """Benchmark a synchronous call."""
+    call()  # warm up
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000)
+    return _summary(timings, *_measure_memory(call))
+
+
+async def async_bench(
+    call: Callable[[], Awaitable[Any]], iterations: int
+) -> dict[str, Any]:
+    """Benchmark a coroutine factory."""
+    await call()  # warm up
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await call()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    await call()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    net_blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return _summary(timings, peak, net_blocks)
+
+
+def _decode(payload: bytes) -> EnergyChartsResponse:
+    """Decode a payload the way the API client does."""
+    decoder = EnergyChartsStreamDecoder()
+    for start in range(0, len(payload), API_CHUNK_SIZE):
+        decoder.feed(payload[start : start + API_CHUNK_SIZE])
+    return decoder.finish()
+
+
+def _client(
+    session: aiohttp.ClientSession, country: str, base_url: str, cache: Any = None
+) -> EnergyChartsApiClient:
+    """Create an API client requesting the stand-in server."""
+    kwargs = {} if cache is None else {"cache": cache}
+    with patch.object(api, "API_BASE_URL", base_url):
+        return EnergyChartsApiClient(session, country, **kwargs)
+
+
+def _coordinator(
+    hass: HomeAssistant, entry: Any, client: EnergyChartsApiClient, store: Any
+) -> EnergyChartsDataUpdateCoordinator:
+    """Create a coordinator for the entry, with a store if it takes one."""
+    args = [hass, entry, client]
+    if "store" in inspect.signature(EnergyChartsDataUpdateCoordinator).parameters:
+        args.append(store)
+    coordinator = EnergyChartsDataUpdateCoordinator(*args)
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    return coordinator
+
+
+async def _refresh(coordinator: EnergyChartsDataUpdateCoordinator) -> dict[str, Any]:
+    """Refresh a coordinator and return its data.
+
+    Raises:
+        RuntimeError: The refresh failed
+
+    """
+    await coordinator.async_refresh()
+    if not coordinator.last_update_success:
+        raise RuntimeError(f"Refresh of {coordinator.name} failed") from (
+            coordinator.last_exception
+        )
+    return coordinator.data
+
+
+async def _sensors(
+    coordinator: EnergyChartsDataUpdateCoordinator, entry: Any
+) -> list[Any]:
+    """Create every sensor the entry would get."""
+    entities: list[Any] = []
+    await sensor.async_setup_entry(coordinator.hass, entry, entities.extend)
+    return entities
+
+
+async def run_country(
+    hass: HomeAssistant,
+    session: aiohttp.ClientSession,
+    base_url: str,
+    country: str,
+    kind: str,
+    iterations: int,
+    synthetic: bool,
+) -> dict[str, dict[str, Any]]:
+    """Run all benchmarks for the fixture of one country and kind."""
+    entry = SimpleNamespace(
+        entry_id=f"benchmark_{country}_{kind}",
+        data={CONF_COUNTRY: country, CONF_HISTORICAL_RANGE: kind},
+        options={},
+    )
+    store = EnergyChartsResponseStore(hass) if EnergyChartsResponseStore else None
+
+    async def cold_refresh() -> dict[str, Any]:
+        client = _client(session, country, base_url)
+        return await _refresh(_coordinator(hass, entry, client, store))
+
+    results = {"refresh": await async_bench(cold_refresh, iterations)}
+
+    if EnergyChartsResponseCache is not None:
+        # Every entry is stale at once, so each refresh is revalidated
+        client = _client(
+            session, country, base_url, EnergyChartsResponseCache(ttl=timedelta(0))
+        )
+        coordinator = _coordinator(hass, entry, client, store)
+        results["revalidate"] = await async_bench(
+            lambda: _refresh(coordinator), iterations
+        )
+
+    payload = load_fixture(country, KINDS[kind], synthetic)
+    raw = json.loads(payload)
+    if EnergyChartsStreamDecoder is not None:
+        results["decode"] = bench(lambda: _decode(payload), iterations)
+    results["from_api_response"] = bench(
+        lambda: EnergyChartsResponse.from_api_response(raw), iterations
+    )
+
+    coordinator = _coordinator(hass, entry, _client(session, country, base_url), store)
+    await _refresh(coordinator)
+    entities = await _sensors(coordinator, entry)
+
+    def entity_state() -> list[tuple[Any, Any]]:
+        return [
+            (entity.native_value, entity.extra_state_attributes)
+            for entity in entities
+        ]
+
+    def entity_update() -> list[tuple[Any, Any]]:
+        coordinator.async_set_updated_data(dict(coordinator.data))
+        return entity_state()
+
+    results["entity_update"] = bench(entity_update, iterations)
+    results["entity_state"] = bench(entity_state, iterations)
+    return results
+
+
+def _discard_background_task(target: Awaitable[Any], name: str) -> None:
+    """Drop a background task instead of running it."""
+    target.close()
+
+
+_IMPORT_SCRIPT = """
+import importlib, sys, time
+start = time.perf_counter()
+package = importlib.import_module("custom_components.energy_charts")
+integration = time.perf_counter()
+for module in getattr(package, "RUNTIME_MODULES", ()):
+    importlib.import_module(f"custom_components.energy_charts.{module}")
+runtime = time.perf_counter()
+print((integration - start) * 1000, (runtime - integration) * 1000)
+"""
+
+
+def import_times(iterations: int) -> dict[str, dict[str, Any]]:
+    """Measure import times of the integration in fresh interpreters."""
+    integration: list[float] = []
+    runtime: list[float] = []
+    for _ in range(iterations):
+        output = subprocess.run(
+            [sys.executable, "-c", _IMPORT_SCRIPT],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        integration.append(float(output[0]))
+        runtime.append(float(output[1]))
+    return {
+        "import/integration": _summary(integration, 0, 0),
+        "import/runtime": _summary(runtime, 0, 0),
+    }
+
+
+async def run(countries: list[str], iterations: int, synthetic: bool) -> dict[str, Any]:
+    """Run the benchmarks of all countries and kinds."""
+    server = FixtureServer(tuple(countries), synthetic)
+    checksums = {
+        f"{country}/{endpoint}": checksum(body)
+        for (country, endpoint), (body, _) in server.payloads.items()
+    }
+    base_url = await server.start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        # Background work, like the statistics import, needs the recorder,
+        # which is not set up here; it runs outside of the refresh anyway
+        hass.async_create_background_task = _discard_background_task
+        results: dict[str, Any] = {}
+        async with aiohttp.ClientSession() as session:
+            for country in countries:
+                for kind in KINDS:
+                    country_results = await run_country(
+                        hass, session, base_url, country, kind, iterations, synthetic
+                    )
+                    for name, result in country_results.items():
+                        results[f"{country}/{kind}/{name}"] = result
+                    print(f"{country} {kind} done", file=sys.stderr)
+
+    await server.stop()
+    results.update(import_times(iterations))
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "fixtures": {
+            "kind": "synthetic" if synthetic else "recorded",
+            "checksums": checksums,
+        },
+        "iterations": iterations,
+        "results": results,
+    }
+
+
+def mismatched_fixtures(baseline: dict[str, Any], current: dict[str, Any]) -> list[str]:
+    """Return the fixtures two runs both used but with different content."""
+    base = baseline["fixtures"]["checksums"]
+    now = current["fixtures"]["checksums"]
+    return sorted(name for name in base.keys() & now.keys() if base[name] != now[name])
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> bool:
+    """Print the change against a baseline and return whether it regressed."""
+    regressed = False
+    print(f"{'benchmark':50} {'base ms':>10} {'now ms':>10} {'ratio':>7} {'peak KiB':>16}")
+    for name, now in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        ratio = now["median_ms"] / base["median_ms"] if base["median_ms"] else 1.0
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressed = True
+        print(
+            f"{name:50} {base['median_ms']:10.3f} {now['median_ms']:10.3f} "
+            f"{ratio:7.2f} {base['peak_kib']:7.1f}->{now['peak_kib']:7.1f}{flag}"
+        )
+    return regressed
+
+
+def main() -> None:
+    """Parse arguments, run the benchmarks and report."""
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--countries", nargs="+", default=list(COUNTRIES))
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--output", type=Path, help="write results to this file")
+    parser.add_argument("--compare", type=Path, help="baseline results to compare")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="median ratio above which a benchmark counts as regressed",
+    )
+    parser.add_argument(
+        "--synthetic",
+        action="store_true",
+        help="run on synthetic payloads instead of the recorded fixtures",
+    )
+    args = parser.parse_args()
+
+    try:
+        # The clock ticks from the pinned moment, so timings stay real
+        with freeze_time(PINNED_NOW, tick=True, real_asyncio=True):
+            current = asyncio.run(run(args.countries, args.iterations, args.synthetic))
+    except FixtureMissingError as err:
+        parser.error(str(err))
+
+    if args.output:
+        args.output.write_text(json.dumps(current, indent=2) + "\n")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if mismatched := mismatched_fixtures(baseline, current):
+            parser.exit(
+                2,
+                "error: the runs used different fixtures, so they are not "
+                f"comparable: {', '.join(mismatched)}\n",
+            )
+        if compare(baseline, current, args.threshold):
+            sys.exit(1)
+    elif not args.output:
+        print(json.dumps(current, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Local stand-in for the Energy-Charts API serving benchmark fixtures.
+
+Serves /charts/power/data/<country>/<endpoint> from the fixtures of the
+pinned endpoint files; any other file is answered with 404 like a file the
+real server has not published. ETag and If-None-Match are supported like on
+the real server.
+
+    python benchmarks/server.py [--port 8765] [--synthetic]
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+
+from aiohttp import web
+
+from fixtures import COUNTRIES, ENDPOINTS, FixtureMissingError, load_fixture
+
+DATA_PATH = "/charts/power/data"
+
+
+class FixtureServer:
+    """aiohttp application replaying the fixtures."""
+
+    def __init__(
+        self, countries: tuple[str, ...] = COUNTRIES, synthetic: bool = False
+    ) -> None:
+        """Load the fixtures of the given countries.
+
+        Raises:
+            FixtureMissingError: A fixture has not been recorded
+
+        """
+        self.payloads: dict[tuple[str, str], tuple[bytes, str]] = {}
+        self.requests = 0
+        for country in countries:
+            for endpoint in ENDPOINTS:
+                body = load_fixture(country, endpoint, synthetic)
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                self.payloads[(country, endpoint)] = (body, etag)
+
+        self.app = web.Application()
+        self.app.router.add_get(DATA_PATH + "/{country}/{endpoint}", self._handle)
+        self._runner: web.AppRunner | None = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        """Serve the fixture matching a request."""
+        self.requests += 1
+        entry = self.payloads.get(
+            (request.match_info["country"], request.match_info["endpoint"])
+        )
+        if entry is None:
+            raise web.HTTPNotFound()
+
+        body, etag = entry
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(
+            body=body, content_type="application/json", headers={"ETag": etag}
+        )
+
+    async def start(self, port: int = 0) -> str:
+        """Start serving on localhost and return the API base URL."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", port)
+        await site.start()
+        host, bound_port = self._runner.addresses[0][:2]
+        return f"http://{host}:{bound_port}{DATA_PATH}"
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+def main() -> None:
+    """Serve the fixtures until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--synthetic", action="store_true", help="serve synthetic payloads"
+    )
+    args = parser.parse_args()
+    try:
+        server = FixtureServer(synthetic=args.synthetic)
+    except FixtureMissingError as err:
+        parser.error(str(err))
+    web.run_app(server.app, host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
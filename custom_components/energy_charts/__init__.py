@@ -1,21 +1,57 @@
 """The Energy-Charts integration."""
 from __future__ import annotations
 
+import importlib
 import logging
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.typing import ConfigType
 
-from .api import EnergyChartsApiClient
-from .const import CONF_COUNTRY, DOMAIN
-from .coordinator import EnergyChartsDataUpdateCoordinator
+from .const import CONF_COUNTRY, CONF_ENABLE_FORECASTS, CONF_HUB_MODE, DOMAIN
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+# Modules only needed once an entry is set up
+RUNTIME_MODULES = ("api", "cache", "coordinator", "hub", "metrics", "store")
+
+
+def _import_runtime_modules() -> float:
+    """Import the modules needed to run an entry.
+
+    Returns:
+        Time the imports took in milliseconds
+
+    """
+    start = time.perf_counter()
+    for module in RUNTIME_MODULES:
+        importlib.import_module(f"{__name__}.{module}")
+    return (time.perf_counter() - start) * 1000
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Energy-Charts integration.
+
+    Args:
+        hass: Home Assistant instance
+        config: Configuration
+
+    Returns:
+        True if setup was successful
+
+    """
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Energy-Charts from a config entry.
@@ -30,27 +66,61 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """
     _LOGGER.debug("Setting up Energy-Charts integration for %s", entry.data[CONF_COUNTRY])
 
+    # The client, models and coordinator are only imported once an entry is
+    # set up, so loading the integration with no enabled entries stays cheap
+    import_ms = await hass.async_add_import_executor_job(_import_runtime_modules)
+    _LOGGER.debug("Imported Energy-Charts modules in %.1f ms", import_ms)
+
+    # pylint: disable=import-outside-toplevel
+    from .api import EnergyChartsApiClient
+    from .cache import async_get_response_cache
+    from .coordinator import EnergyChartsDataUpdateCoordinator
+    from .hub import async_get_hub
+    from .metrics import STAGE_IMPORT
+    from .store import async_get_response_store
+
+    # The options flow stores changed settings in the entry options
+    config = {**entry.data, **entry.options}
+
     # Create API client
     session = async_get_clientsession(hass)
     api_client = EnergyChartsApiClient(
         session=session,
         country=entry.data[CONF_COUNTRY],
+        cache=async_get_response_cache(hass),
+        include_forecasts=config.get(CONF_ENABLE_FORECASTS, False),
     )
+    api_client.metrics.record(STAGE_IMPORT, import_ms)
 
     # Create coordinator
+    hub_mode = config.get(CONF_HUB_MODE, False)
     coordinator = EnergyChartsDataUpdateCoordinator(
         hass=hass,
         entry=entry,
         api_client=api_client,
+        store=async_get_response_store(hass),
+        hub_mode=hub_mode,
     )
 
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    # Populate from the stored snapshot and refresh in the background,
+    # or block on the initial fetch when there is nothing stored yet
+    if await coordinator.async_restore():
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            f"{DOMAIN}_{entry.data[CONF_COUNTRY]}_initial_refresh",
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     # Store coordinator
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    # Poll together with the other hub-mode entries
+    if hub_mode:
+        entry.async_on_unload(async_get_hub(hass).async_add(coordinator))
+
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -0,0 +1,178 @@
+"""Aggregation of Energy-Charts series over full time ranges."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Mapping
+from operator import add, or_
+
+from .const import (
+    CATEGORY_FOSSIL,
+    CATEGORY_NUCLEAR,
+    CATEGORY_RENEWABLE,
+    FOSSIL_SOURCES,
+    HYDRO_SOURCES,
+    SENSOR_FOSSIL_TOTAL,
+    SENSOR_HYDRO_TOTAL,
+    SENSOR_RENEWABLE_SHARE,
+    SENSOR_SOLAR_TOTAL,
+    SENSOR_TOTAL_FOSSIL,
+    SENSOR_TOTAL_NUCLEAR,
+    SENSOR_TOTAL_PRODUCTION,
+    SENSOR_TOTAL_RENEWABLE,
+    SENSOR_WIND_TOTAL,
+    SOLAR_SOURCES,
+    SOURCE_CATEGORIES,
+    WIND_SOURCES,
+)
+from .models import NAN, EnergyDataSeries, is_forecast_key
+
+# Production totals by source category
+_CATEGORY_TOTALS = {
+    CATEGORY_RENEWABLE: SENSOR_TOTAL_RENEWABLE,
+    CATEGORY_FOSSIL: SENSOR_TOTAL_FOSSIL,
+    CATEGORY_NUCLEAR: SENSOR_TOTAL_NUCLEAR,
+}
+
+# Category totals by member source keys
+_GROUP_TOTALS = {
+    SENSOR_SOLAR_TOTAL: SOLAR_SOURCES,
+    SENSOR_WIND_TOTAL: WIND_SOURCES,
+    SENSOR_HYDRO_TOTAL: HYDRO_SOURCES,
+    SENSOR_FOSSIL_TOTAL: FOSSIL_SOURCES,
+}
+
+
+class AggregatedSeries:
+    """Aggregate totals for every timestamp of a response.
+
+    Each total is a float64 array aligned with the timestamps; NaN marks
+    timestamps for which none of the contributing sources has data.
+    """
+
+    __slots__ = ("timestamps", "values")
+
+    def __init__(
+        self, timestamps: array[int], values: dict[str, array[float]]
+    ) -> None:
+        """Initialize the aggregate series.
+
+        Args:
+            timestamps: Unix timestamps in milliseconds
+            values: Aggregate arrays by sensor key
+
+        """
+        self.timestamps = timestamps
+        self.values = values
+
+    def get(self, key: str) -> array[float] | None:
+        """Get the aggregate array for a sensor key."""
+        return self.values.get(key)
+
+
+def _targets(source_key: str, categories: Mapping[str, str]) -> list[str]:
+    """Return the aggregate keys a source contributes to."""
+    targets = []
+    if (total := _CATEGORY_TOTALS.get(categories.get(source_key, ""))) is not None:
+        targets.append(total)
+        targets.append(SENSOR_TOTAL_PRODUCTION)
+    targets.extend(
+        group for group, members in _GROUP_TOTALS.items() if source_key in members
+    )
+    return targets
+
+
+def aggregate_series(
+    series: Iterable[EnergyDataSeries],
+    timestamps: array[int],
+    categories: Mapping[str, str] = SOURCE_CATEGORIES,
+    previous: AggregatedSeries | None = None,
+    start: int = 0,
+) -> AggregatedSeries:
+    """Compute aggregate totals and renewable share for every timestamp.
+
+    Every source series is visited once: its values are NaN-filtered
+    once and then added element-wise into each total it belongs to.
+    Given the aggregates of an earlier version of the same series, only
+    the points from the first changed index on are computed and the ones
+    before it are copied, so a refresh costs time proportional to the
+    new points.
+
+    Args:
+        series: Series of one response
+        timestamps: Timestamps shared by the series
+        categories: Mapping of source key to category
+        previous: Aggregates of an earlier version of the same series
+        start: Index of the first value changed since previous
+
+    Returns:
+        Aggregate arrays for totals, category totals and renewable share
+
+    """
+    length = len(timestamps)
+    if previous is None or start > min(len(previous.timestamps), length):
+        start = 0
+    tail = length - start
+    sums: dict[str, list[float]] = {}
+    present: dict[str, list[bool]] = {}
+
+    for item in series:
+        source_key = item.key.lower()
+        if is_forecast_key(source_key):
+            continue
+        targets = _targets(source_key, categories)
+        if not targets:
+            continue
+
+        data = item.data[start:length]
+        valid = [value == value for value in data]
+        values = [value if ok else 0.0 for value, ok in zip(data, valid)]
+        if len(values) < tail:
+            padding = tail - len(values)
+            values.extend([0.0] * padding)
+            valid.extend([False] * padding)
+
+        for target in targets:
+            if target in sums:
+                sums[target] = list(map(add, sums[target], values))
+                present[target] = list(map(or_, present[target], valid))
+            else:
+                sums[target] = values
+                present[target] = valid
+
+    result: dict[str, array[float]] = {}
+    for key in (
+        SENSOR_TOTAL_PRODUCTION,
+        *_CATEGORY_TOTALS.values(),
+        *_GROUP_TOTALS,
+    ):
+        if key not in sums:
+            result[key] = array("d", [NAN]) * tail
+            continue
+        result[key] = array(
+            "d",
+            [
+                total if ok else NAN
+                for total, ok in zip(sums[key], present[key])
+            ],
+        )
+
+    # Renewable share is 0 where there is production data but no output
+    total = result[SENSOR_TOTAL_PRODUCTION]
+    renewable = sums.get(SENSOR_TOTAL_RENEWABLE, [0.0] * tail)
+    result[SENSOR_RENEWABLE_SHARE] = array(
+        "d",
+        [
+            NAN if production != production
+            else (share / production * 100 if production > 0 else 0.0)
+            for production, share in zip(total, renewable)
+        ],
+    )
+
+    # Unchanged points keep their previous aggregates
+    if start:
+        result = {
+            key: previous.values[key][:start] + values
+            for key, values in result.items()
+        }
+
+    return AggregatedSeries(timestamps, result)
@@ -4,12 +4,16 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime
-from typing import Any
+import time
 
 import aiohttp
+from aiohttp import hdrs
 
-from .const import API_BASE_URL, API_TIMEOUT
-from .models import EnergyChartsResponse
+from .cache import EnergyChartsResponseCache
+from .const import API_BASE_URL, API_CHUNK_SIZE, API_TIMEOUT
+from .decoder import EnergyChartsStreamDecoder
+from .metrics import STAGE_DECODE, STAGE_REQUEST, EnergyChartsMetrics
+from .models import EnergyChartsResponse, is_forecast_key
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,33 +41,51 @@ class EnergyChartsApiClient:
         self,
         session: aiohttp.ClientSession,
         country: str = "de",
+        cache: EnergyChartsResponseCache | None = None,
+        include_forecasts: bool = False,
     ) -> None:
         """Initialize the API client.
 
         Args:
             session: aiohttp ClientSession for making requests
             country: Country code (de, at, ch, fr, nl, be, pl, cz)
+            cache: Response cache to share with other clients
+            include_forecasts: Whether to decode forecast series
 
         """
         self._session = session
         self._country = country.lower()
         self._base_url = API_BASE_URL
+        self._cache = cache if cache is not None else EnergyChartsResponseCache()
+        self._include_forecasts = include_forecasts
+        self.metrics = EnergyChartsMetrics()
+
+    def _series_filter(self, key: str) -> bool:
+        """Return whether a series is decoded."""
+        return self._include_forecasts or not is_forecast_key(key)
 
     async def _make_request(
         self,
         endpoint: str,
         retries: int = 3,
         backoff_factor: float = 1.0,
-    ) -> list[dict[str, Any]]:
-        """Make an API request with retry logic.
+        use_cache: bool = True,
+    ) -> EnergyChartsResponse:
+        """Make an API request, sharing it with concurrent identical calls.
+
+        Concurrent calls for the same URL, from this or any other client
+        sharing the response cache, await a single request and receive the
+        same parsed response. This covers overlapping scheduled refreshes,
+        manual entity updates and reloads.
 
         Args:
             endpoint: API endpoint (e.g., "day.json")
             retries: Number of retry attempts
             backoff_factor: Exponential backoff factor
+            use_cache: Whether to use and update the response cache
 
         Returns:
-            Raw API response data
+            Parsed Energy Charts response
 
         Raises:
             EnergyChartsConnectionError: Connection failed
@@ -73,9 +95,59 @@ class EnergyChartsApiClient:
 
         """
         url = f"{self._base_url}/{self._country}/{endpoint}"
+
+        async def request() -> EnergyChartsResponse:
+            self.metrics.requests += 1
+            with self.metrics.time(STAGE_REQUEST):
+                return await self._async_request(
+                    url, endpoint, retries, backoff_factor, use_cache
+                )
+
+        # Responses decoded with a different series filter are not shareable,
+        # and a caller updating the cache must not join one that bypasses it
+        return await self._cache.async_single_flight(
+            (url, self._include_forecasts, use_cache), request
+        )
+
+    async def _async_request(
+        self,
+        url: str,
+        endpoint: str,
+        retries: int,
+        backoff_factor: float,
+        use_cache: bool,
+    ) -> EnergyChartsResponse:
+        """Make a conditional API request with retry logic.
+
+        The ETag and Last-Modified validators of every successful response
+        are kept in the response cache. When the server answers a later
+        request with 304 Not Modified, the previously parsed response is
+        returned without decoding or validating anything. Otherwise the
+        body is decoded incrementally while it is read, dropping series
+        that are not needed.
+
+        Args:
+            url: Full URL of the endpoint
+            endpoint: API endpoint (e.g., "day.json")
+            retries: Number of retry attempts
+            backoff_factor: Exponential backoff factor
+            use_cache: Whether to use and update the response cache
+
+        Returns:
+            Parsed Energy Charts response
+
+        Raises:
+            EnergyChartsConnectionError: Connection failed
+            EnergyChartsTimeoutError: Request timed out
+            EnergyChartsNotFoundError: Resource not found (404)
+            EnergyChartsDataError: Invalid data received
+
+        """
         last_exception: Exception | None = None
 
         for attempt in range(retries):
+            if attempt:
+                self.metrics.retries += 1
             try:
                 timeout = aiohttp.ClientTimeout(total=API_TIMEOUT * (attempt + 1))
 
@@ -86,27 +158,68 @@ class EnergyChartsApiClient:
                     retries,
                 )
 
-                async with self._session.get(url, timeout=timeout) as response:
+                cached = None
+                if use_cache:
+                    cached = self._cache.get_entry(
+                        self._country, endpoint, self._include_forecasts
+                    )
+                headers: dict[str, str] = {}
+                if cached is not None:
+                    if cached.etag:
+                        headers[hdrs.IF_NONE_MATCH] = cached.etag
+                    if cached.last_modified:
+                        headers[hdrs.IF_MODIFIED_SINCE] = cached.last_modified
+
+                async with self._session.get(
+                    url, timeout=timeout, headers=headers
+                ) as response:
                     if response.status == 404:
                         raise EnergyChartsNotFoundError(
                             f"Resource not found: {url}"
                         )
 
-                    response.raise_for_status()
+                    if response.status == 304 and cached is not None:
+                        _LOGGER.debug("Data at %s not modified", url)
+                        self.metrics.not_modified += 1
+                        self._cache.touch(self._country, endpoint)
+                        return cached.response
 
-                    data = await response.json()
+                    response.raise_for_status()
 
-                    if not isinstance(data, list):
-                        raise EnergyChartsDataError(
-                            f"Expected list, got {type(data).__name__}"
-                        )
+                    # Only the time spent decoding counts, not waiting for chunks
+                    decoder = EnergyChartsStreamDecoder(self._series_filter)
+                    decode_seconds = 0.0
+                    async for chunk in response.content.iter_chunked(
+                        API_CHUNK_SIZE
+                    ):
+                        start = time.perf_counter()
+                        decoder.feed(chunk)
+                        decode_seconds += time.perf_counter() - start
+                    start = time.perf_counter()
+                    parsed = decoder.finish()
+                    decode_seconds += time.perf_counter() - start
+
+                    self.metrics.record(STAGE_DECODE, decode_seconds * 1000)
+                    self.metrics.record_download(decoder.bytes_read)
 
                     _LOGGER.debug(
-                        "Successfully fetched data from %s (%d series)",
+                        "Successfully fetched data from %s (%d series, %d skipped, %d bytes)",
                         url,
-                        len(data),
+                        len(parsed.data_series),
+                        decoder.series_skipped,
+                        decoder.bytes_read,
                     )
-                    return data
+
+                    if use_cache:
+                        self._cache.set(
+                            self._country,
+                            endpoint,
+                            parsed,
+                            etag=response.headers.get(hdrs.ETAG),
+                            last_modified=response.headers.get(hdrs.LAST_MODIFIED),
+                            complete=self._include_forecasts,
+                        )
+                    return parsed
 
             except asyncio.TimeoutError as err:
                 last_exception = EnergyChartsTimeoutError(
@@ -155,6 +268,52 @@ class EnergyChartsApiClient:
 
         raise EnergyChartsConnectionError("Failed to fetch data after all retries")
 
+    @staticmethod
+    def current_week_endpoint() -> str:
+        """Return the endpoint file name for the current ISO week."""
+        year, week, _ = datetime.now().isocalendar()
+        return f"week_{year}_{week:02d}.json"
+
+    @staticmethod
+    def current_month_endpoint() -> str:
+        """Return the endpoint file name for the current month."""
+        now = datetime.now()
+        return f"month_{now.year}_{now.month:02d}.json"
+
+    async def get_endpoint(
+        self, endpoint: str, use_cache: bool = True
+    ) -> EnergyChartsResponse:
+        """Get and parse data for an arbitrary endpoint file.
+
+        Fresh responses are served from the response cache, otherwise
+        concurrent calls for the same endpoint share a single request.
+
+        Args:
+            endpoint: API endpoint (e.g., "week_2025_44.json")
+            use_cache: Whether to use the response cache; disable for
+                one-off historical files that would evict current data
+
+        Returns:
+            Parsed Energy Charts response for the endpoint
+
+        Raises:
+            EnergyChartsConnectionError: Connection failed
+            EnergyChartsTimeoutError: Request timed out
+            EnergyChartsNotFoundError: Resource not found
+            EnergyChartsDataError: Invalid data received
+
+        """
+        if use_cache and (
+            response := self._cache.get_fresh(
+                self._country, endpoint, self._include_forecasts
+            )
+        ) is not None:
+            _LOGGER.debug("Response cache hit for %s/%s", self._country, endpoint)
+            self.metrics.cache_hits += 1
+            return response
+
+        return await self._make_request(endpoint, use_cache=use_cache)
+
     async def get_current_day(self) -> EnergyChartsResponse:
         """Get current day/week data.
 
@@ -171,10 +330,7 @@ class EnergyChartsApiClient:
 
         """
         # Use current week data since there's no daily endpoint
-        now = datetime.now()
-        year, week, _ = now.isocalendar()
-        data = await self._make_request(f"week_{year}_{week:02d}.json")
-        return EnergyChartsResponse.from_api_response(data)
+        return await self.get_endpoint(self.current_week_endpoint())
 
     async def get_current_week(self) -> EnergyChartsResponse:
         """Get current week data.
@@ -188,10 +344,7 @@ class EnergyChartsApiClient:
             EnergyChartsDataError: Invalid data received
 
         """
-        now = datetime.now()
-        year, week, _ = now.isocalendar()
-        data = await self._make_request(f"week_{year}_{week:02d}.json")
-        return EnergyChartsResponse.from_api_response(data)
+        return await self.get_endpoint(self.current_week_endpoint())
 
     async def get_current_month(self) -> EnergyChartsResponse:
         """Get current month data.
@@ -205,11 +358,7 @@ class EnergyChartsApiClient:
             EnergyChartsDataError: Invalid data received
 
         """
-        now = datetime.now()
-        year = now.year
-        month = now.month
-        data = await self._make_request(f"month_{year}_{month:02d}.json")
-        return EnergyChartsResponse.from_api_response(data)
+        return await self.get_endpoint(self.current_month_endpoint())
 
     async def get_specific_week(self, year: int, week: int) -> EnergyChartsResponse:
         """Get data for a specific week.
@@ -228,8 +377,7 @@ class EnergyChartsApiClient:
             EnergyChartsDataError: Invalid data received
 
         """
-        data = await self._make_request(f"week_{year}_{week:02d}.json")
-        return EnergyChartsResponse.from_api_response(data)
+        return await self.get_endpoint(f"week_{year}_{week:02d}.json")
 
     async def get_specific_month(self, year: int, month: int) -> EnergyChartsResponse:
         """Get data for a specific month.
@@ -248,8 +396,7 @@ class EnergyChartsApiClient:
             EnergyChartsDataError: Invalid data received
 
         """
-        data = await self._make_request(f"month_{year}_{month:02d}.json")
-        return EnergyChartsResponse.from_api_response(data)
+        return await self.get_endpoint(f"month_{year}_{month:02d}.json")
 
     async def test_connection(self) -> bool:
         """Test if the API is reachable and responding.
@@ -0,0 +1,227 @@
+"""Historical backfill for Energy-Charts."""
+from __future__ import annotations
+
+import asyncio
+import calendar
+from datetime import date, timedelta
+import logging
+import time
+from urllib.parse import urlparse
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .aggregation import aggregate_series
+from .api import EnergyChartsApiClient, EnergyChartsNotFoundError
+from .const import (
+    API_BASE_URL,
+    BACKFILL_CONCURRENCY,
+    BACKFILL_MIN_REQUEST_INTERVAL,
+    DATA_RATE_LIMITERS,
+    DOMAIN,
+)
+from .models import EnergyChartsResponse
+from .query import slice_range
+from .statistics import (
+    EnergyChartsStatisticsImporter,
+    StatisticsSource,
+    statistics_sources,
+)
+from .window import week_endpoint
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def plan_backfill(start: date, end: date) -> list[str]:
+    """Plan the endpoint files covering a date range.
+
+    Each month touched by the range is covered by its month file if that
+    replaces at least two week files, and by the week files overlapping
+    it otherwise, so the plan needs as few files as possible. A week
+    reaching into the next month of the range is not replaced, as that
+    month still needs it. Week files
+    shared by neighbouring months are only planned once.
+
+    Args:
+        start: First day of the range
+        end: Last day of the range (inclusive)
+
+    Returns:
+        Endpoint file names in chronological order
+
+    """
+    endpoints: dict[str, None] = {}
+    month_start = start.replace(day=1)
+
+    while month_start <= end:
+        days_in_month = calendar.monthrange(month_start.year, month_start.month)[1]
+        month_end = month_start.replace(day=days_in_month)
+        first = max(start, month_start)
+        last = min(end, month_end)
+
+        weeks: dict[str, None] = {}
+        day = first
+        while day <= last:
+            weeks[week_endpoint(day)] = None
+            day += timedelta(days=7 - day.weekday())
+        new_weeks = [week for week in weeks if week not in endpoints]
+        replaced = len(new_weeks)
+        if end > month_end and month_end.weekday() != 6 and new_weeks:
+            # The last week reaches into the next month, which still needs it
+            replaced -= 1
+
+        if replaced >= 2:
+            endpoints[f"month_{month_start.year}_{month_start.month:02d}.json"] = None
+        else:
+            endpoints.update(dict.fromkeys(new_weeks))
+
+        month_start = month_end + timedelta(days=1)
+
+    return list(endpoints)
+
+
+def _local_midnight_ms(day: date) -> int:
+    """Return the start of a local day in Unix milliseconds."""
+    return int(dt_util.start_of_local_day(day).timestamp() * 1000)
+
+
+def clip_sources(
+    sources: dict[str, StatisticsSource], start_ms: int, end_ms: int
+) -> dict[str, StatisticsSource]:
+    """Clip statistics sources to a time range.
+
+    Args:
+        sources: Series to import by key
+        start_ms: First timestamp to keep
+        end_ms: Last timestamp to keep
+
+    Returns:
+        Series to import by key, without the points outside the range
+
+    """
+    clipped: dict[str, StatisticsSource] = {}
+    for key, (name, unit, timestamps, values) in sources.items():
+        timestamps, values = slice_range(timestamps, values, start_ms, end_ms)
+        clipped[key] = (name, unit, timestamps, values)
+    return clipped
+
+
+class HostRateLimiter:
+    """Space out request starts to one API host."""
+
+    def __init__(self, min_interval: float) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            min_interval: Minimum seconds between two request starts
+
+        """
+        self._min_interval = min_interval
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        """Wait until the next request may start."""
+        async with self._lock:
+            delay = self._next_start - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start = time.monotonic() + self._min_interval
+
+
+class EnergyChartsBackfill:
+    """Fetch historical files concurrently and import them as statistics."""
+
+    def __init__(
+        self,
+        api_client: EnergyChartsApiClient,
+        importer: EnergyChartsStatisticsImporter,
+        rate_limiter: HostRateLimiter,
+        concurrency: int = BACKFILL_CONCURRENCY,
+    ) -> None:
+        """Initialize the backfill.
+
+        Args:
+            api_client: API client of the country to backfill
+            importer: Statistics importer of the country
+            rate_limiter: Rate limiter shared by all requests to the API host
+            concurrency: Maximum number of requests in flight
+
+        """
+        self._api_client = api_client
+        self._importer = importer
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._rate_limiter = rate_limiter
+
+    async def _fetch(self, endpoint: str) -> EnergyChartsResponse | None:
+        """Fetch one file within the concurrency and rate limits."""
+        async with self._semaphore:
+            await self._rate_limiter.wait()
+            try:
+                # Historical files would only evict current data from the cache
+                return await self._api_client.get_endpoint(endpoint, use_cache=False)
+            except EnergyChartsNotFoundError:
+                _LOGGER.warning("No data available for %s", endpoint)
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.warning("Failed to fetch %s: %s", endpoint, err)
+            return None
+
+    async def async_run(self, start: date, end: date) -> tuple[int, int]:
+        """Backfill statistics for a date range.
+
+        Files extend beyond the range and overwrite hours already imported,
+        so their points are clipped to the range to leave the hours outside
+        it untouched.
+
+        Args:
+            start: First day of the range
+            end: Last day of the range (inclusive)
+
+        Returns:
+            Number of files imported and number of files planned
+
+        """
+        endpoints = plan_backfill(start, end)
+        start_ms = _local_midnight_ms(start)
+        end_ms = _local_midnight_ms(end + timedelta(days=1)) - 1
+        _LOGGER.debug("Backfilling %s to %s from %s", start, end, endpoints)
+
+        imported = 0
+        for future in asyncio.as_completed([self._fetch(e) for e in endpoints]):
+            response = await future
+            if response is None:
+                continue
+
+            sources = clip_sources(
+                statistics_sources(
+                    response,
+                    aggregate_series(response.data_series, response.timestamps),
+                ),
+                start_ms,
+                end_ms,
+            )
+            await self._importer.async_import(sources, incremental=False)
+            imported += 1
+
+        return imported, len(endpoints)
+
+
+@callback
+def async_get_rate_limiter(
+    hass: HomeAssistant, base_url: str = API_BASE_URL
+) -> HostRateLimiter:
+    """Return the rate limiter shared by all requests to a host.
+
+    Args:
+        hass: Home Assistant instance
+        base_url: URL on the host to limit
+
+    Returns:
+        Shared rate limiter stored in hass.data
+
+    """
+    host = urlparse(base_url).netloc
+    limiters = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_RATE_LIMITERS, {})
+    if (limiter := limiters.get(host)) is None:
+        limiter = limiters[host] = HostRateLimiter(BACKFILL_MIN_REQUEST_INTERVAL)
+    return limiter
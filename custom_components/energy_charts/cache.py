@@ -0,0 +1,165 @@
+"""Shared response cache for Energy-Charts."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from datetime import timedelta
+import logging
+import time
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DATA_RESPONSE_CACHE,
+    DOMAIN,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_TTL,
+)
+from .models import EnergyChartsResponse
+
+_LOGGER = logging.getLogger(__name__)
+
+CacheKey = tuple[str, str]
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """Parsed response with its HTTP validators and fetch time."""
+
+    response: EnergyChartsResponse
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    complete: bool = True
+
+
+class EnergyChartsResponseCache:
+    """Process-wide cache of parsed responses keyed by (country, endpoint).
+
+    Entries younger than the TTL are served without touching the network.
+    Older entries are kept until evicted (least recently used first) so
+    their validators can still be used for conditional requests.
+    It also keeps the requests in flight, so concurrent fetches of every
+    client can be coalesced into one request.
+
+    Responses decoded without their forecast series are marked incomplete
+    and are not served to callers that require every series.
+    """
+
+    def __init__(
+        self,
+        ttl: timedelta = RESPONSE_CACHE_TTL,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Time an entry is served without revalidation
+            max_entries: Maximum number of entries before LRU eviction
+
+        """
+        self._ttl = ttl.total_seconds()
+        self._max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, CachedResponse] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task[EnergyChartsResponse]] = {}
+
+    def get_entry(
+        self, country: str, endpoint: str, complete: bool = False
+    ) -> CachedResponse | None:
+        """Return the cached entry for a key regardless of its age.
+
+        Args:
+            country: Country code
+            endpoint: API endpoint
+            complete: Whether the entry must include every series
+
+        """
+        key = (country, endpoint)
+        entry = self._entries.get(key)
+        if entry is None or (complete and not entry.complete):
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get_fresh(
+        self, country: str, endpoint: str, complete: bool = False
+    ) -> EnergyChartsResponse | None:
+        """Return the cached response if it is younger than the TTL."""
+        entry = self.get_entry(country, endpoint, complete)
+        if entry is None or time.monotonic() - entry.fetched_at > self._ttl:
+            return None
+        return entry.response
+
+    def set(
+        self,
+        country: str,
+        endpoint: str,
+        response: EnergyChartsResponse,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        complete: bool = True,
+    ) -> None:
+        """Store a freshly fetched response."""
+        key = (country, endpoint)
+        self._entries[key] = CachedResponse(
+            response=response,
+            fetched_at=time.monotonic(),
+            etag=etag,
+            last_modified=last_modified,
+            complete=complete,
+        )
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            _LOGGER.debug("Evicted %s/%s from response cache", *evicted)
+
+    def touch(self, country: str, endpoint: str) -> None:
+        """Mark an entry as fresh after the server confirmed it is unchanged."""
+        entry = self.get_entry(country, endpoint)
+        if entry is not None:
+            entry.fetched_at = time.monotonic()
+
+    async def async_single_flight(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[EnergyChartsResponse]],
+    ) -> EnergyChartsResponse:
+        """Run a fetch once for all concurrent callers with the same key.
+
+        Args:
+            key: Identity of the request, e.g. its URL
+            fetch: Coroutine factory performing the actual request
+
+        Returns:
+            Parsed Energy Charts response shared by all callers
+
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            _LOGGER.debug("Joining in-flight request for %s", key)
+
+        # Shield so a cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+
+
+def async_get_response_cache(hass: HomeAssistant) -> EnergyChartsResponseCache:
+    """Return the response cache shared by all entries and flows.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Shared response cache stored in hass.data
+
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (cache := domain_data.get(DATA_RESPONSE_CACHE)) is None:
+        cache = domain_data[DATA_RESPONSE_CACHE] = EnergyChartsResponseCache()
+    return cache
@@ -13,13 +13,16 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import EnergyChartsApiClient
+from .cache import async_get_response_cache
 from .const import (
+    CONF_ADAPTIVE_POLLING,
     CONF_COUNTRY,
     CONF_ENABLE_AGGREGATED,
     CONF_ENABLE_CATEGORIES,
     CONF_ENABLE_INDIVIDUAL,
     CONF_ENABLE_FORECASTS,
     CONF_HISTORICAL_RANGE,
+    CONF_HUB_MODE,
     CONF_LANGUAGE,
     CONF_UPDATE_INTERVAL,
     DEFAULT_COUNTRY,
@@ -57,7 +60,11 @@ async def validate_connection(
 
     """
     session = async_get_clientsession(hass)
-    client = EnergyChartsApiClient(session=session, country=country)
+    client = EnergyChartsApiClient(
+        session=session,
+        country=country,
+        cache=async_get_response_cache(hass),
+    )
 
     if not await client.test_connection():
         raise ValueError("Cannot connect to Energy-Charts API")
@@ -210,6 +217,8 @@ class EnergyChartsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Optional(CONF_LANGUAGE, default=DEFAULT_LANGUAGE): vol.In(
                     SUPPORTED_LANGUAGES
                 ),
+                vol.Optional(CONF_HUB_MODE, default=False): bool,
+                vol.Optional(CONF_ADAPTIVE_POLLING, default=False): bool,
             }
         )
 
@@ -264,7 +273,7 @@ class EnergyChartsOptionsFlow(config_entries.OptionsFlow):
             return self.async_create_entry(title="", data=user_input)
 
         # Get current values
-        current_data = self.config_entry.data
+        current_data = {**self.config_entry.data, **self.config_entry.options}
 
         # Show form with current values
         data_schema = vol.Schema(
@@ -304,6 +313,14 @@ class EnergyChartsOptionsFlow(config_entries.OptionsFlow):
                     CONF_LANGUAGE,
                     default=current_data.get(CONF_LANGUAGE, DEFAULT_LANGUAGE),
                 ): vol.In(SUPPORTED_LANGUAGES),
+                vol.Optional(
+                    CONF_HUB_MODE,
+                    default=current_data.get(CONF_HUB_MODE, False),
+                ): bool,
+                vol.Optional(
+                    CONF_ADAPTIVE_POLLING,
+                    default=current_data.get(CONF_ADAPTIVE_POLLING, False),
+                ): bool,
             }
         )
 
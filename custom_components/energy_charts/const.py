@@ -19,6 +19,8 @@ CONF_ENABLE_CATEGORIES: Final = "enable_categories"
 CONF_ENABLE_FORECASTS: Final = "enable_forecasts"
 CONF_HISTORICAL_RANGE: Final = "historical_data_range"
 CONF_LANGUAGE: Final = "language"
+CONF_HUB_MODE: Final = "hub_mode"
+CONF_ADAPTIVE_POLLING: Final = "adaptive_polling"
 
 # Defaults
 DEFAULT_COUNTRY: Final = "de"
@@ -29,6 +31,67 @@ DEFAULT_LANGUAGE: Final = "de"
 # API
 API_BASE_URL: Final = "https://www.energy-charts.info/charts/power/data"
 API_TIMEOUT: Final = 30
+API_CHUNK_SIZE: Final = 64 * 1024
+
+# Shared response cache
+DATA_RESPONSE_CACHE: Final = "response_cache"
+RESPONSE_CACHE_TTL: Final = timedelta(minutes=2)
+RESPONSE_CACHE_MAX_ENTRIES: Final = 32
+
+# Persistent response store
+DATA_RESPONSE_STORE: Final = "response_store"
+STORAGE_KEY: Final = f"{DOMAIN}.responses"
+STORAGE_VERSION: Final = 1
+STORAGE_SAVE_DELAY: Final = 30
+
+# Publication-aware polling
+DATA_RESOLUTION: Final = timedelta(minutes=15)
+ADAPTIVE_MIN_INTERVAL: Final = timedelta(minutes=1)
+ADAPTIVE_LAG_PRECISION: Final = timedelta(seconds=30)
+ADAPTIVE_MARGIN: Final = timedelta(seconds=30)
+ADAPTIVE_LAG_SAMPLES: Final = 16
+
+# Rolling window across week files
+ROLLING_WINDOW_DAY: Final = timedelta(hours=24)
+ROLLING_WINDOW_WEEK: Final = timedelta(days=7)
+WEEK_PREFETCH_LEAD: Final = timedelta(minutes=15)
+PREVIOUS_WEEK_SETTLE: Final = timedelta(hours=2)
+
+# Forecasts
+FORECAST_HOURS: Final = 24
+FORECAST_HORIZONS: Final = (1, 3, 6, 12, 24)
+
+# Downsampling for charts
+DOWNSAMPLE_LTTB: Final = "lttb"
+DOWNSAMPLE_BUCKETS: Final = "buckets"
+DOWNSAMPLE_MODES: Final = [DOWNSAMPLE_LTTB, DOWNSAMPLE_BUCKETS]
+DOWNSAMPLE_POINTS: Final = 200
+
+# Number of sources listed in the total production attributes
+TOP_SOURCES_COUNT: Final = 5
+
+# Shared polling schedule of hub-mode entries
+DATA_HUB: Final = "hub"
+
+# Long-term statistics
+STATISTICS_BATCH_SIZE: Final = 500
+
+# Historical backfill
+BACKFILL_CONCURRENCY: Final = 4
+BACKFILL_MIN_REQUEST_INTERVAL: Final = 0.5
+DATA_RATE_LIMITERS: Final = "rate_limiters"
+
+# Services
+SERVICE_BACKFILL: Final = "backfill"
+ATTR_START_DATE: Final = "start_date"
+ATTR_END_DATE: Final = "end_date"
+SERVICE_GET_SERIES: Final = "get_series"
+ATTR_SOURCE: Final = "source"
+ATTR_START: Final = "start"
+ATTR_END: Final = "end"
+ATTR_BUCKET: Final = "bucket"
+ATTR_MAX_POINTS: Final = "max_points"
+ATTR_MODE: Final = "mode"
 
 # Update Intervals
 MIN_UPDATE_INTERVAL: Final = 5
@@ -89,6 +152,23 @@ STORAGE_SOURCES: Final = [
     "battery_storage",
 ]
 
+# Category Sensor Members
+SOLAR_SOURCES: Final = [
+    "photovoltaic",
+    "solar",
+]
+
+WIND_SOURCES: Final = [
+    "wind_onshore",
+    "wind_offshore",
+]
+
+HYDRO_SOURCES: Final = [
+    "hydro_run-of-river",
+    "hydro_water_reservoir",
+    "hydro_pumped_storage",
+]
+
 # Source Categories Mapping
 SOURCE_CATEGORIES: Final = {
     # Renewable
@@ -179,6 +259,8 @@ ATTR_COLOR: Final = "color"
 ATTR_CATEGORY: Final = "category"
 ATTR_LAST_VALUE_TIMESTAMP: Final = "last_value_timestamp"
 ATTR_IS_FORECAST: Final = "is_forecast"
+ATTR_FORECAST: Final = "forecast"
+ATTR_FORECAST_SOURCE: Final = "forecast_source"
 ATTR_HISTORY_TODAY: Final = "history_today"
 ATTR_DAILY_PEAK: Final = "daily_peak"
 ATTR_DAILY_AVERAGE: Final = "daily_average"
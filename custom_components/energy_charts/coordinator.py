@@ -1,12 +1,14 @@
 """DataUpdateCoordinator for Energy-Charts integration."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import asyncio
+from datetime import UTC, datetime, timedelta
 import logging
+import time
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
@@ -19,17 +21,28 @@ from .api import (
     EnergyChartsTimeoutError,
 )
 from .const import (
+    API_BASE_URL,
     CATEGORY_FOSSIL,
     CATEGORY_NUCLEAR,
     CATEGORY_RENEWABLE,
+    CONF_ADAPTIVE_POLLING,
     CONF_COUNTRY,
     CONF_HISTORICAL_RANGE,
     CONF_UPDATE_INTERVAL,
     DOMAIN,
+    DOWNSAMPLE_LTTB,
+    DOWNSAMPLE_POINTS,
     FOSSIL_SOURCES,
+    HISTORICAL_RANGE_DAY,
+    HISTORICAL_RANGE_MONTH,
     HISTORICAL_RANGE_NONE,
+    HISTORICAL_RANGE_WEEK,
+    HYDRO_SOURCES,
     NUCLEAR_SOURCES,
+    PREVIOUS_WEEK_SETTLE,
     RENEWABLE_SOURCES,
+    ROLLING_WINDOW_DAY,
+    ROLLING_WINDOW_WEEK,
     SENSOR_FOSSIL_TOTAL,
     SENSOR_HYDRO_TOTAL,
     SENSOR_RENEWABLE_SHARE,
@@ -39,12 +52,38 @@ from .const import (
     SENSOR_TOTAL_PRODUCTION,
     SENSOR_TOTAL_RENEWABLE,
     SENSOR_WIND_TOTAL,
+    SOLAR_SOURCES,
     SOURCE_CATEGORIES,
+    TOP_SOURCES_COUNT,
+    WEEK_PREFETCH_LEAD,
+    WIND_SOURCES,
 )
-from .models import CoordinatorData, EnergyChartsResponse
+from .aggregation import aggregate_series
+from .delta import IncrementalSeries
+from .downsample import DownsampledPoint, downsample
+from .forecast import extract_forecasts
+from .metrics import STAGE_PROCESS, STAGE_REFRESH
+from .models import EnergyChartsResponse, Point, is_forecast_key
+from .polling import AdaptivePollSchedule
+from .query import find_series, slice_range
+from .statistics import EnergyChartsStatisticsImporter, statistics_sources
+from .store import EnergyChartsResponseStore
+from .window import RollingWindow, adjacent_week_endpoint, stitch, week_endpoint
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fetch plan purposes
+FETCH_CURRENT = "current"
+FETCH_PREVIOUS = "previous"
+FETCH_NEXT = "next"
+FETCH_HISTORY = "history"
+
+# Data sections whose changes are published per key
+CHANGE_SECTIONS = ("sources", "aggregated", "categories", "derived", "forecasts")
+
+# A changed key of a data section, e.g. ("sources", "solar")
+DataKey = tuple[str, str]
+
 
 class EnergyChartsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching Energy-Charts data."""
@@ -54,6 +93,8 @@ class EnergyChartsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         hass: HomeAssistant,
         entry: ConfigEntry,
         api_client: EnergyChartsApiClient,
+        store: EnergyChartsResponseStore,
+        hub_mode: bool = False,
     ) -> None:
         """Initialize the coordinator.
 
@@ -61,24 +102,55 @@ class EnergyChartsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hass: Home Assistant instance
             entry: Config entry
             api_client: API client instance
+            store: Persistent response store
+            hub_mode: Leave scheduling to the shared hub instead of
+                running an own timer
 
         """
         self.api_client = api_client
+        self._store = store
+        self._series_state: dict[str, dict[str, IncrementalSeries]] = {}
+        self._window = RollingWindow()
+        self._window_key: str | None = None
+        self._downsampled: dict[tuple[str, str, int], list[DownsampledPoint]] = {}
+        self._changed_keys: frozenset[DataKey] | None = None
+        self._notified_success: bool | None = None
         self.entry = entry
         self.country = entry.data[CONF_COUNTRY]
+        self._statistics = EnergyChartsStatisticsImporter(hass, self.country)
 
-        update_interval = timedelta(
-            minutes=entry.data.get(CONF_UPDATE_INTERVAL, 15)
+        # The options flow stores changed settings in the entry options
+        self.config = {**entry.data, **entry.options}
+        self.poll_interval = timedelta(
+            minutes=self.config.get(CONF_UPDATE_INTERVAL, 15)
         )
 
+        # The hub schedules its members, so adaptive polling needs an own timer
+        self._poll_schedule: AdaptivePollSchedule | None = None
+        if self.config.get(CONF_ADAPTIVE_POLLING, False) and not hub_mode:
+            self._poll_schedule = AdaptivePollSchedule(self.poll_interval)
+
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{self.country}",
-            update_interval=update_interval,
+            update_interval=None if hub_mode else self.poll_interval,
         )
 
     async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data from API and record how long the refresh took.
+
+        Returns:
+            Structured data dictionary for sensors
+
+        Raises:
+            UpdateFailed: When update fails
+
+        """
+        with self.api_client.metrics.time(STAGE_REFRESH):
+            return await self._async_fetch_data()
+
+    async def _async_fetch_data(self) -> dict[str, Any]:
         """Fetch data from API.
 
         Returns:
@@ -88,21 +160,30 @@ class EnergyChartsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             UpdateFailed: When update fails
 
         """
-        try:
-            # Fetch current day data
-            response = await self.api_client.get_current_day()
+        plan = self._plan_fetch(self._historical_range)
 
-            # Process and structure the data
-            structured_data = self._process_response(response)
+        # Fall back to the configured interval until a poll succeeds
+        if self._poll_schedule is not None:
+            self.update_interval = self.poll_interval
 
-            # Optionally fetch historical data
-            historical_range = self.entry.data.get(CONF_HISTORICAL_RANGE, HISTORICAL_RANGE_NONE)
-            if historical_range != HISTORICAL_RANGE_NONE:
-                structured_data["history"] = await self._fetch_historical_data(
-                    historical_range
+        try:
+            responses = await self._fetch_planned(plan)
+
+            # The current snapshot is mandatory unless a version of it is
+            # held, e.g. prefetched before the week boundary; history is
+            # best effort
+            response = responses[plan[FETCH_CURRENT]]
+            if isinstance(response, Exception):
+                if plan[FETCH_CURRENT] not in self._window:
+                    raise response
+                _LOGGER.warning(
+                    "Failed to fetch %s, using the held version: %s",
+                    plan[FETCH_CURRENT],
+                    response,
                 )
 
-            return structured_data
+            with self.api_client.metrics.time(STAGE_PROCESS):
+                structured_data = self._build_data(plan, responses)
 
         except EnergyChartsConnectionError as err:
             raise UpdateFailed(f"Connection error: {err}") from err
@@ -113,38 +194,445 @@ class EnergyChartsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except Exception as err:
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
-    def _process_response(self, response: EnergyChartsResponse) -> dict[str, Any]:
+        # Poll again just after the next point is expected
+        if self._poll_schedule is not None:
+            self.update_interval = self._poll_schedule.next_interval(
+                self._latest_published_ms(), int(time.time() * 1000)
+            )
+            _LOGGER.debug(
+                "Next %s poll in %s (publication lag %s)",
+                self.country,
+                self.update_interval,
+                self._poll_schedule.publication_lag,
+            )
+
+        # Import new complete hours into the recorder's long-term statistics
+        if self.data is None or structured_data["aggregated_series"] is not self.data.get(
+            "aggregated_series"
+        ):
+            self.hass.async_create_background_task(
+                self._statistics.async_import(
+                    statistics_sources(
+                        structured_data["raw_response"],
+                        structured_data["aggregated_series"],
+                    )
+                ),
+                f"{DOMAIN}_{self.country}_import_statistics",
+            )
+
+        # Persist the last good responses for a fast start after restart
+        persisted = self._window.files
+        if FETCH_HISTORY in plan and isinstance(
+            history := responses[plan[FETCH_HISTORY]], EnergyChartsResponse
+        ):
+            persisted[plan[FETCH_HISTORY]] = history
+        self._store.async_save_responses(self.country, persisted)
+
+        return structured_data
+
+    async def async_restore(self) -> bool:
+        """Populate data from the persisted snapshot, if there is one.
+
+        Returns:
+            True if the current snapshot was restored
+
+        """
+        plan = self._plan_fetch(self._historical_range)
+        responses = await self._store.async_get_responses(
+            self.country, list(dict.fromkeys(plan.values()))
+        )
+        if plan[FETCH_CURRENT] not in responses:
+            return False
+
+        missing = {
+            endpoint: EnergyChartsDataError(f"No stored data for {endpoint}")
+            for endpoint in plan.values()
+            if endpoint not in responses
+        }
+        _LOGGER.debug("Restoring %s data from stored snapshot", self.country)
+        self.async_set_updated_data(self._build_data(plan, {**responses, **missing}))
+        return True
+
+    def _latest_published_ms(self) -> int | None:
+        """Return the timestamp of the newest published point.
+
+        Forecast series and values labelled in the future are ignored, as
+        they are published ahead of time.
+
+        Returns:
+            Unix timestamp in milliseconds, or None without data
+
+        """
+        now_ms = time.time() * 1000
+        return max(
+            (
+                latest
+                for source_key, state in self._series_state.get(
+                    self._window_key, {}
+                ).items()
+                if not is_forecast_key(source_key)
+                and (latest := state.latest_timestamp_ms) is not None
+                and latest <= now_ms
+            ),
+            default=None,
+        )
+
+    @property
+    def _historical_range(self) -> str:
+        """Return the configured historical data range."""
+        return self.config.get(CONF_HISTORICAL_RANGE, HISTORICAL_RANGE_NONE)
+
+    @staticmethod
+    def _window_span(historical_range: str) -> timedelta:
+        """Return how far back the rolling window reaches for a range."""
+        if historical_range == HISTORICAL_RANGE_WEEK:
+            return ROLLING_WINDOW_WEEK
+        return ROLLING_WINDOW_DAY
+
+    def _build_data(
+        self,
+        plan: dict[str, str],
+        responses: dict[str, EnergyChartsResponse | Exception],
+    ) -> dict[str, Any]:
+        """Build structured data from the responses of a fetch plan.
+
+        Args:
+            plan: Mapping of purpose to endpoint file name
+            responses: Mapping of endpoint to parsed response or exception
+
+        Returns:
+            Structured data dictionary for sensors
+
+        """
+        # Hold the fetched week files; held versions stand in for failed ones
+        for purpose in (FETCH_PREVIOUS, FETCH_CURRENT, FETCH_NEXT):
+            if purpose in plan and isinstance(
+                result := responses[plan[purpose]], EnergyChartsResponse
+            ):
+                self._window.set(plan[purpose], result)
+
+        # Stitch the previous week in front while the window reaches into it
+        current_endpoint = plan[FETCH_CURRENT]
+        current = self._window.get(current_endpoint)
+        previous_endpoint = adjacent_week_endpoint(current_endpoint, -1)
+        window_start_ms = int(
+            (time.time() - self._window_span(self._historical_range).total_seconds())
+            * 1000
+        )
+        endpoints = [current_endpoint]
+        if (
+            previous_endpoint in self._window
+            and current.timestamps
+            and window_start_ms < current.timestamps[0]
+        ):
+            endpoints.insert(0, previous_endpoint)
+        self._window.retain([*endpoints, adjacent_week_endpoint(current_endpoint, 1)])
+
+        held = self._window.files
+        window = stitch([held[endpoint] for endpoint in endpoints])
+        window_key = "+".join(endpoints)
+
+        # Merge the window and the month file into the incremental series state
+        sources = {window_key: window}
+        if FETCH_HISTORY in plan and isinstance(
+            result := responses[plan[FETCH_HISTORY]], EnergyChartsResponse
+        ):
+            sources[plan[FETCH_HISTORY]] = result
+        merged = {
+            key: self._merge_response(key, response)
+            for key, response in sources.items()
+        }
+        self._series_state = {key: states for key, (states, _, _) in merged.items()}
+        self._window_key = window_key
+
+        # Process and structure the data
+        window_states, window_changed, first_changed = merged[window_key]
+        structured_data = self._process_response(
+            window, window_states, bool(window_changed), first_changed
+        )
+
+        structured_data["derived"] = self._derive_attributes(
+            structured_data, f"{API_BASE_URL}/{self.country}/{current_endpoint}"
+        )
+
+        # Forecasts come with the window files, so they cost no request
+        structured_data["forecasts"] = extract_forecasts(
+            window, int(time.time() * 1000)
+        )
+
+        # Day and week history are the tail of the window, month its own file
+        history_changed: set[str] = set()
+        if self._historical_range in (HISTORICAL_RANGE_DAY, HISTORICAL_RANGE_WEEK):
+            if window_changed or not self.data:
+                (
+                    structured_data["history"],
+                    structured_data["history_stats"],
+                ) = self._build_historical_data(window_states, window_start_ms)
+                history_changed = window_changed
+            else:
+                structured_data["history"] = self.data["history"]
+                structured_data["history_stats"] = self.data["history_stats"]
+        elif FETCH_HISTORY in plan:
+            history_endpoint = plan[FETCH_HISTORY]
+            if history_endpoint in merged:
+                (
+                    structured_data["history"],
+                    structured_data["history_stats"],
+                ) = self._build_historical_data(merged[history_endpoint][0])
+                history_changed = merged[history_endpoint][1]
+            else:
+                _LOGGER.warning(
+                    "Failed to fetch historical data: %s", responses[history_endpoint]
+                )
+
+        # Downsampled series are cached until the window they came from changes
+        if window_changed or not self.data:
+            self._downsampled = {}
+
+        self._changed_keys = self._find_changed_keys(structured_data, history_changed)
+
+        return structured_data
+
+    def downsampled(
+        self,
+        key: str,
+        threshold: int = DOWNSAMPLE_POINTS,
+        mode: str = DOWNSAMPLE_LTTB,
+    ) -> list[DownsampledPoint] | None:
+        """Return a source or aggregate downsampled for charts.
+
+        Each resolution is computed on first use and cached until the
+        underlying data changes, so all readers of a refresh share it.
+
+        Args:
+            key: Source or aggregate key
+            threshold: Maximum number of points
+            mode: "lttb" or "buckets"
+
+        Returns:
+            Downsampled points, or None if there is no such series
+
+        """
+        cache_key = (key, mode, threshold)
+        if (cached := self._downsampled.get(cache_key)) is not None:
+            return cached
+
+        response = self.data["raw_response"]
+        values = find_series(response, self.data.get("aggregated_series"), key)
+        if values is None:
+            return None
+        timestamps, values = slice_range(response.timestamps, values)
+        result = self._downsampled[cache_key] = downsample(
+            timestamps, values, threshold, mode
+        )
+        return result
+
+    def _find_changed_keys(
+        self, data: dict[str, Any], history_changed: set[str]
+    ) -> frozenset[DataKey] | None:
+        """Work out which data keys differ from the previous refresh.
+
+        Args:
+            data: Structured data of this refresh
+            history_changed: Source keys whose historical series changed
+
+        Returns:
+            Changed (section, key) pairs, or None if everything is new
+
+        """
+        if not self.data:
+            return None
+
+        changed: set[DataKey] = set()
+        for section in CHANGE_SECTIONS:
+            new = data[section]
+            old = self.data.get(section, {})
+            if new is old:
+                continue
+            changed.update(
+                (section, key)
+                for key in new.keys() | old.keys()
+                if new.get(key) != old.get(key)
+            )
+
+        # Points may be updated in place, so history changes come from the merge
+        history_keys = data["history"].keys() ^ self.data["history"].keys()
+        changed.update(("history", key) for key in history_changed | history_keys)
+
+        return frozenset(changed)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners whose data keys changed.
+
+        Listeners subscribe with a context of the (section, key) pairs they
+        read, or without context to be notified on every update. Everyone
+        is notified on the first update and when availability changes.
+        """
+        changed = self._changed_keys
+        if changed is None or self._notified_success != self.last_update_success:
+            self._notified_success = self.last_update_success
+            super().async_update_listeners()
+            return
+
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or not changed.isdisjoint(context):
+                update_callback()
+
+    def _merge_response(
+        self, endpoint: str, response: EnergyChartsResponse
+    ) -> tuple[dict[str, IncrementalSeries], set[str], int]:
+        """Merge a response into the series state kept for its endpoint.
+
+        Only the points from the first changed index of each series are
+        processed, so a refresh costs time proportional to the new points.
+
+        Args:
+            endpoint: Endpoint the response was fetched from
+            response: Parsed response
+
+        Returns:
+            Series state by source key, the keys of the series that
+            changed, appeared or disappeared, and the first index at which
+            any series changed
+
+        """
+        previous = self._series_state.get(endpoint, {})
+        states: dict[str, IncrementalSeries] = {}
+        changed: set[str] = set()
+        first_changed = len(response.timestamps)
+
+        for series in response.data_series:
+            source_key = series.key.lower()
+            state = previous.get(source_key)
+            if state is None:
+                state = IncrementalSeries()
+            if (index := state.update(series)) is not None:
+                changed.add(source_key)
+                first_changed = min(first_changed, index)
+            states[source_key] = state
+
+        if appeared_or_gone := states.keys() ^ previous.keys():
+            changed.update(appeared_or_gone)
+            first_changed = 0
+
+        return states, changed, first_changed
+
+    def _plan_fetch(self, historical_range: str) -> dict[str, str]:
+        """Work out which endpoint files this refresh cycle needs.
+
+        The previous week's file is only fetched while the rolling window
+        reaches back into it and it is not held yet, or its last points
+        may still be settling. The next week's file is prefetched once,
+        shortly before the boundary.
+
+        Args:
+            historical_range: One of "none", "day", "week", "month"
+
+        Returns:
+            Mapping of purpose (current, previous, next, history) to
+            endpoint file name
+
+        """
+        now = datetime.now()
+        current_endpoint = week_endpoint(now.date())
+        plan = {FETCH_CURRENT: current_endpoint}
+
+        week_started = datetime.combine(
+            now.date() - timedelta(days=now.weekday()), datetime.min.time()
+        )
+        previous_endpoint = adjacent_week_endpoint(current_endpoint, -1)
+        if now - self._window_span(historical_range) < week_started and (
+            previous_endpoint not in self._window
+            or now - week_started < PREVIOUS_WEEK_SETTLE
+        ):
+            plan[FETCH_PREVIOUS] = previous_endpoint
+
+        next_endpoint = adjacent_week_endpoint(current_endpoint, 1)
+        if (
+            week_started + timedelta(weeks=1) - now <= WEEK_PREFETCH_LEAD
+            and next_endpoint not in self._window
+        ):
+            plan[FETCH_NEXT] = next_endpoint
+
+        # There is no daily endpoint, so "day" and "week" use the window
+        if historical_range == HISTORICAL_RANGE_MONTH:
+            plan[FETCH_HISTORY] = self.api_client.current_month_endpoint()
+
+        return plan
+
+    async def _fetch_planned(
+        self, plan: dict[str, str]
+    ) -> dict[str, EnergyChartsResponse | Exception]:
+        """Download and parse each distinct endpoint of a fetch plan once.
+
+        Args:
+            plan: Mapping of purpose to endpoint file name
+
+        Returns:
+            Mapping of endpoint to parsed response, or the raised exception
+
+        """
+        endpoints = list(dict.fromkeys(plan.values()))
+        results = await asyncio.gather(
+            *(self.api_client.get_endpoint(endpoint) for endpoint in endpoints),
+            return_exceptions=True,
+        )
+        return dict(zip(endpoints, results))
+
+    def _process_response(
+        self,
+        response: EnergyChartsResponse,
+        states: dict[str, IncrementalSeries],
+        changed: bool = True,
+        first_changed: int = 0,
+    ) -> dict[str, Any]:
         """Process API response into structured data.
 
         Args:
             response: API response object
+            states: Incremental series state by source key
+            changed: Whether any series changed since the previous refresh
+            first_changed: First index at which any series changed
 
         Returns:
             Structured data dictionary
 
         """
         data: dict[str, Any] = {
-            "timestamp": datetime.now(),
+            "timestamp": datetime.now(UTC),
             "raw_response": response,
             "sources": {},
             "aggregated": {},
             "categories": {},
             "history": {},
+            "history_stats": {},
+            "aggregated_series": None,
             "forecasts": {},
+            "derived": {},
         }
 
+        # Nothing new was published, keep the previous values
+        if not changed and self.data:
+            data["sources"] = self.data["sources"]
+            data["aggregated"] = self.data["aggregated"]
+            data["categories"] = self.data["categories"]
+            data["aggregated_series"] = self.data["aggregated_series"]
+            return data
+
         # Process individual sources
         for series in response.data_series:
             source_key = series.key.lower()
 
-            # Skip forecast series for now (they typically have "_planned" suffix)
-            if "_planned" in source_key or "forecast" in source_key:
+            # Forecast series are extracted separately
+            if is_forecast_key(source_key):
                 continue
 
+            state = states[source_key]
             source_data = {
-                "value": series.latest_value,
+                "value": state.latest_value,
                 "unit": "MW",
-                "timestamp": series.latest_timestamp,
+                "timestamp": state.latest_timestamp,
                 "name_en": series.name_en,
                 "name_de": series.name_de,
                 "color": series.color,
@@ -160,8 +648,69 @@ class EnergyChartsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Calculate category sums
         data["categories"] = self._calculate_categories(data["sources"])
 
+        # Extend the aggregates of every timestamp from the changed tail
+        data["aggregated_series"] = aggregate_series(
+            response.data_series,
+            response.timestamps,
+            previous=self.data.get("aggregated_series") if self.data else None,
+            start=first_changed,
+        )
+
         return data
 
+    def _derive_attributes(
+        self, data: dict[str, Any], api_url: str
+    ) -> dict[str, Any]:
+        """Precompute values shared by the sensor attributes.
+
+        Computed once per refresh instead of on every state write, and
+        reused as is while the sources are unchanged.
+
+        Args:
+            data: Structured data of this refresh
+            api_url: URL of the current data file
+
+        Returns:
+            Derived values for the sensor attributes
+
+        """
+        if (
+            self.data
+            and self.data["sources"] is data["sources"]
+            and self.data["derived"].get("api_url") == api_url
+        ):
+            return self.data["derived"]
+
+        producing = [
+            (key, source)
+            for key, source in data["sources"].items()
+            if (source["value"] or 0) > 0
+        ]
+        top_sources = sorted(
+            producing, key=lambda item: item[1]["value"], reverse=True
+        )[:TOP_SOURCES_COUNT]
+
+        return {
+            "api_url": api_url,
+            "source_count": len(producing),
+            "top_sources": [
+                [source.get("name_en", key), round(source["value"], 2)]
+                for key, source in top_sources
+            ],
+            "renewable_sources": [
+                source.get("name_en", key)
+                for key, source in producing
+                if source.get("category") == CATEGORY_RENEWABLE
+            ],
+            "fossil_breakdown": {
+                f"{fuel}_mw": round(
+                    sum(source["value"] for key, source in producing if fuel in key),
+                    2,
+                )
+                for fuel in ("coal", "gas", "oil")
+            },
+        }
+
     def _calculate_aggregated(
         self, sources: dict[str, dict[str, Any]]
     ) -> dict[str, float]:
@@ -231,25 +780,21 @@ class EnergyChartsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Solar total (photovoltaic + solar)
         solar_total = 0.0
-        for key in ["photovoltaic", "solar"]:
+        for key in SOLAR_SOURCES:
             if key in sources and sources[key].get("value"):
                 solar_total += sources[key]["value"]
         categories[SENSOR_SOLAR_TOTAL] = round(solar_total, 2)
 
         # Wind total (onshore + offshore)
         wind_total = 0.0
-        for key in ["wind_onshore", "wind_offshore"]:
+        for key in WIND_SOURCES:
             if key in sources and sources[key].get("value"):
                 wind_total += sources[key]["value"]
         categories[SENSOR_WIND_TOTAL] = round(wind_total, 2)
 
         # Hydro total (run-of-river + reservoir + pumped storage)
         hydro_total = 0.0
-        for key in [
-            "hydro_run-of-river",
-            "hydro_water_reservoir",
-            "hydro_pumped_storage",
-        ]:
+        for key in HYDRO_SOURCES:
             if key in sources and sources[key].get("value"):
                 hydro_total += sources[key]["value"]
         categories[SENSOR_HYDRO_TOTAL] = round(hydro_total, 2)
@@ -263,40 +808,33 @@ class EnergyChartsDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return categories
 
-    async def _fetch_historical_data(
-        self, historical_range: str
-    ) -> dict[str, list[tuple[datetime, float]]]:
-        """Fetch historical data based on configured range.
+    def _build_historical_data(
+        self, states: dict[str, IncrementalSeries], start_ms: int | None = None
+    ) -> tuple[
+        dict[str, list[Point]], dict[str, dict[str, float | None]]
+    ]:
+        """Build historical data from the incremental series state.
 
         Args:
-            historical_range: One of "day", "week", "month"
+            states: Series state of the historical range file by source key
+            start_ms: Only include points from this Unix timestamp in
+                milliseconds on
 
         Returns:
-            Dictionary with historical data
+            Historical points and their peak/average by source key
 
         """
-        history: dict[str, list[tuple[datetime, float]]] = {}
-
-        try:
-            if historical_range == "day":
-                response = await self.api_client.get_current_day()
-            elif historical_range == "week":
-                response = await self.api_client.get_current_week()
-            elif historical_range == "month":
-                response = await self.api_client.get_current_month()
-            else:
-                return history
-
-            # Convert to historical format
-            for series in response.data_series:
-                source_key = series.key.lower()
-                history[source_key] = [
-                    (datetime.fromtimestamp(ts / 1000), float(val))
-                    for ts, val in series.data
-                    if val is not None
-                ]
-
-        except Exception as err:
-            _LOGGER.warning("Failed to fetch historical data: %s", err)
+        history: dict[str, list[Point]] = {}
+        stats: dict[str, dict[str, float | None]] = {}
+
+        # Convert to historical format
+        for source_key, state in states.items():
+            if start_ms is None:
+                history[source_key] = state.points
+                stats[source_key] = {"peak": state.peak, "average": state.average}
+                continue
+            points, peak, average = state.since(start_ms)
+            history[source_key] = points
+            stats[source_key] = {"peak": peak, "average": average}
 
-        return history
+        return history, stats
@@ -0,0 +1,170 @@
+"""Incremental decoder for Energy-Charts payloads."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable
+import codecs
+import json
+import re
+from typing import Any
+
+from .models import (
+    EnergyChartsResponse,
+    EnergyDataSeries,
+    normalize_name,
+    series_key,
+    to_float_array,
+)
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Parser states
+_START = 0
+_FIRST_ITEM = 1
+_ITEM = 2
+_SEPARATOR = 3
+_DONE = 4
+
+
+class EnergyChartsStreamDecoder:
+    """Decode an Energy-Charts payload from body chunks as they arrive.
+
+    The payload is a JSON array of series objects. Each object is decoded
+    as soon as it is complete and then released, so only the current
+    object and the series that pass the filter are held in memory instead
+    of the whole body plus its fully decoded tree.
+    """
+
+    def __init__(self, series_filter: Callable[[str], bool] | None = None) -> None:
+        """Initialize the decoder.
+
+        Args:
+            series_filter: Called with each series key; series for which it
+                returns False are dropped without building their values
+
+        """
+        self._filter = series_filter
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._state = _START
+        self._retry_at = 0
+        self._timestamps: array[int] | None = None
+        self._series: list[EnergyDataSeries] = []
+        self.bytes_read = 0
+        self.series_skipped = 0
+
+    def feed(self, chunk: bytes) -> None:
+        """Feed the next chunk of the response body.
+
+        Raises:
+            ValueError: The payload is not a JSON array of objects
+
+        """
+        self.bytes_read += len(chunk)
+        self._buffer += self._utf8.decode(chunk)
+        self._parse(final=False)
+
+    def finish(self) -> EnergyChartsResponse:
+        """Complete decoding once the body has been read.
+
+        Returns:
+            Parsed Energy Charts response
+
+        Raises:
+            ValueError: The payload is truncated or malformed
+
+        """
+        self._buffer += self._utf8.decode(b"", final=True)
+        self._parse(final=True)
+        if self._state != _DONE:
+            raise ValueError("Truncated JSON payload")
+
+        return EnergyChartsResponse(
+            data_series=self._series,
+            timestamps=self._timestamps if self._timestamps is not None else array("q"),
+        )
+
+    def _parse(self, final: bool) -> None:
+        """Consume as many complete tokens from the buffer as possible."""
+        buf = self._buffer
+        pos = 0
+
+        while True:
+            pos = _WHITESPACE.match(buf, pos).end()
+            if pos >= len(buf):
+                break
+
+            if self._state == _START:
+                if buf[pos] != "[":
+                    raise ValueError(f"Expected list, got {buf[pos]!r}")
+                pos += 1
+                self._state = _FIRST_ITEM
+
+            elif self._state in (_FIRST_ITEM, _ITEM):
+                if self._state == _FIRST_ITEM and buf[pos] == "]":
+                    pos += 1
+                    self._state = _DONE
+                    continue
+
+                # Only retry a partial object once the buffer has doubled,
+                # which keeps re-scanning amortised linear in the body size
+                if not final and len(buf) - pos < self._retry_at:
+                    break
+                try:
+                    item, pos_end = self._json.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    self._retry_at = 2 * (len(buf) - pos)
+                    break
+
+                self._retry_at = 0
+                pos = pos_end
+                self._handle_item(item)
+                self._state = _SEPARATOR
+
+            elif self._state == _SEPARATOR:
+                if buf[pos] == ",":
+                    self._state = _ITEM
+                elif buf[pos] == "]":
+                    self._state = _DONE
+                else:
+                    raise ValueError(f"Unexpected {buf[pos]!r} in JSON array")
+                pos += 1
+
+            else:
+                raise ValueError("Extra data after JSON array")
+
+        # Release everything that has been consumed
+        self._buffer = buf[pos:]
+
+    def _handle_item(self, item: Any) -> None:
+        """Turn a decoded series object into a series, if it is wanted."""
+        if not isinstance(item, dict):
+            raise ValueError(f"Expected object, got {type(item).__name__}")
+
+        # Timestamps come from the first item and apply to all series
+        if self._timestamps is None:
+            self._timestamps = array("q", item.get("xAxisValues", []))
+
+        # Skip items without name or data
+        if "name" not in item or "data" not in item:
+            return
+
+        name = normalize_name(item["name"])
+        if self._filter is not None and not self._filter(
+            series_key(name.get("en", "Unknown"))
+        ):
+            self.series_skipped += 1
+            return
+
+        self._series.append(
+            EnergyDataSeries(
+                name=name,
+                color=item.get("color", "#000000"),
+                data=to_float_array(item["data"] or ()),
+                timestamps=self._timestamps,
+                visible=item.get("visible", True),
+            )
+        )
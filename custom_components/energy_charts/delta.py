@@ -0,0 +1,200 @@
+"""Incremental state of refreshed Energy-Charts series."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+
+from .models import EnergyDataSeries, Point, to_datetime
+
+# Bytes compared at once while looking for the first changed value
+_BLOCK_SIZE = 4096
+
+
+def first_changed_index(old: array, new: array) -> int:
+    """Return the index of the first element that differs between arrays.
+
+    Elements are compared by their bytes, so NaN compares equal to NaN.
+    When one array is a prefix of the other, the shorter length is returned.
+    """
+    if old is new:
+        return len(new)
+
+    old_bytes = old.tobytes()
+    new_bytes = new.tobytes()
+    length = min(len(old_bytes), len(new_bytes))
+
+    if old_bytes[:length] == new_bytes[:length]:
+        return length // new.itemsize
+
+    # Find the first differing block, then the element within it
+    start = 0
+    while old_bytes[start : start + _BLOCK_SIZE] == new_bytes[start : start + _BLOCK_SIZE]:
+        start += _BLOCK_SIZE
+    index = start // new.itemsize
+    end = length // new.itemsize
+    while index < end and (
+        old[index] == new[index]
+        or (old[index] != old[index] and new[index] != new[index])
+    ):
+        index += 1
+    return index
+
+
+class IncrementalSeries:
+    """Running state of one series that is updated from its changed tail.
+
+    The state tracks the latest valid index, sum, count and peak of the
+    valid values and the (timestamp in ms, value) points. On refresh only the
+    values from the first changed index onwards are processed, so the
+    cost scales with the number of new points instead of the series length.
+    """
+
+    __slots__ = (
+        "_data",
+        "_timestamps",
+        "_point_indexes",
+        "last_index",
+        "total",
+        "count",
+        "peak",
+        "points",
+    )
+
+    def __init__(self) -> None:
+        """Initialize empty state."""
+        self._data: array[float] = array("d")
+        self._timestamps: array[int] = array("q")
+        self._point_indexes: list[int] = []
+        self.last_index: int | None = None
+        self.total = 0.0
+        self.count = 0
+        self.peak: float | None = None
+        self.points: list[Point] = []
+
+    @property
+    def latest_value(self) -> float | None:
+        """Get the most recent non-null value."""
+        if self.last_index is None:
+            return None
+        return self._data[self.last_index]
+
+    @property
+    def latest_timestamp(self) -> datetime | None:
+        """Get the timestamp of the most recent non-null value."""
+        if self.last_index is None or self.last_index >= len(self._timestamps):
+            return None
+        return to_datetime(self._timestamps[self.last_index])
+
+    @property
+    def latest_timestamp_ms(self) -> int | None:
+        """Get the Unix timestamp in milliseconds of the most recent value."""
+        if self.last_index is None or self.last_index >= len(self._timestamps):
+            return None
+        return self._timestamps[self.last_index]
+
+    @property
+    def average(self) -> float | None:
+        """Get the average of all valid values."""
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    def since(self, start_ms: int) -> tuple[list[Point], float | None, float | None]:
+        """Get the points, peak and average from a start time on.
+
+        Args:
+            start_ms: Start as Unix timestamp in milliseconds
+
+        Returns:
+            Points, peak and average of the valid values from the start
+
+        """
+        start = bisect_left(self._timestamps, start_ms)
+        points = self.points[bisect_left(self._point_indexes, start) :]
+        values = [value for value in self._data[start:] if value == value]
+        if not values:
+            return points, None, None
+        return points, max(values), sum(values) / len(values)
+
+    def update(self, series: EnergyDataSeries) -> int | None:
+        """Merge a refreshed series into the state.
+
+        Args:
+            series: Series from the latest response
+
+        Returns:
+            Index of the first changed value, or None when nothing changed
+
+        """
+        old_data = self._data
+        new_data = series.data
+        new_timestamps = series.timestamps
+        if new_data is old_data and new_timestamps is self._timestamps:
+            return None
+
+        changed = min(
+            first_changed_index(old_data, new_data),
+            first_changed_index(self._timestamps, new_timestamps),
+        )
+        if changed == len(new_data) == len(old_data) and len(
+            new_timestamps
+        ) == len(self._timestamps):
+            # Same values in new objects; just keep the newer references
+            self._data = new_data
+            self._timestamps = new_timestamps
+            return None
+
+        # Remove the contribution of the replaced tail
+        recompute_peak = False
+        for value in old_data[changed:]:
+            if value == value:
+                self.total -= value
+                self.count -= 1
+                if value == self.peak:
+                    recompute_peak = True
+
+        del_from = bisect_left(self._point_indexes, changed)
+        del self._point_indexes[del_from:]
+        del self.points[del_from:]
+
+        # Add the contribution of the new tail
+        peak = self.peak
+        for index in range(changed, len(new_data)):
+            value = new_data[index]
+            if value != value:
+                continue
+            self.total += value
+            self.count += 1
+            if peak is None or value > peak:
+                peak = value
+            if index < len(new_timestamps):
+                self._point_indexes.append(index)
+                self.points.append((new_timestamps[index], value))
+        self.peak = peak
+
+        if recompute_peak:
+            valid = [value for value in new_data if value == value]
+            self.peak = max(valid) if valid else None
+        if not self.count:
+            self.total = 0.0
+
+        # Find the latest valid value, scanning the new tail first
+        last_index = None
+        for index in range(len(new_data) - 1, changed - 1, -1):
+            if new_data[index] == new_data[index]:
+                last_index = index
+                break
+        if last_index is None and self.last_index is not None:
+            if self.last_index < changed:
+                last_index = self.last_index
+            else:
+                for index in range(changed - 1, -1, -1):
+                    if new_data[index] == new_data[index]:
+                        last_index = index
+                        break
+        self.last_index = last_index
+
+        self._data = new_data
+        self._timestamps = new_timestamps
+        return changed
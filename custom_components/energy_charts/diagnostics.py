@@ -0,0 +1,42 @@
+"""Diagnostics support for Energy-Charts."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import EnergyChartsDataUpdateCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Args:
+        hass: Home Assistant instance
+        entry: Config entry
+
+    Returns:
+        Configuration, refresh metrics and a summary of the current data
+
+    """
+    coordinator: EnergyChartsDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    data = coordinator.data or {}
+    response = data.get("raw_response")
+
+    return {
+        "entry": dict(entry.data),
+        "options": dict(entry.options),
+        "update_interval": str(coordinator.update_interval),
+        "last_update_success": coordinator.last_update_success,
+        "metrics": coordinator.api_client.metrics.as_dict(),
+        "data": {
+            "timestamp": data["timestamp"].isoformat() if "timestamp" in data else None,
+            "series": len(response.data_series) if response is not None else 0,
+            "points": len(response.timestamps) if response is not None else 0,
+            "sources": sorted(data.get("sources", {})),
+        },
+    }
@@ -0,0 +1,125 @@
+"""Downsampling of Energy-Charts series for charts."""
+from __future__ import annotations
+
+from collections.abc import Sequence
+import math
+
+from .const import DATA_RESOLUTION, DOWNSAMPLE_BUCKETS, DOWNSAMPLE_LTTB
+from .query import bucket_range
+
+_RESOLUTION_MS = int(DATA_RESOLUTION.total_seconds() * 1000)
+
+# A downsampled point: (timestamp, value) for LTTB, or
+# (bucket start, min, max, mean) for buckets
+DownsampledPoint = tuple[float, ...]
+
+
+def lttb(
+    timestamps: Sequence[int], values: Sequence[float], threshold: int
+) -> list[tuple[int, float]]:
+    """Downsample a series with Largest-Triangle-Three-Buckets.
+
+    The first and last points are kept. From every bucket in between, the
+    point spanning the largest triangle with the previously kept point and
+    the average of the next bucket is kept, which preserves peaks and dips
+    far better than averaging.
+
+    Args:
+        timestamps: Sorted Unix timestamps in milliseconds
+        values: Values aligned with the timestamps, NaN for missing values
+        threshold: Maximum number of points to return
+
+    Returns:
+        Kept (timestamp, value) points; all valid points below the threshold
+
+    """
+    points = [
+        (timestamp, value)
+        for timestamp, value in zip(timestamps, values)
+        if value == value
+    ]
+    length = len(points)
+    if threshold >= length or threshold < 3:
+        return points
+
+    sampled = [points[0]]
+    every = (length - 2) / (threshold - 2)
+    kept = 0
+
+    for bucket in range(threshold - 2):
+        # Average of the next bucket
+        next_start = int((bucket + 1) * every) + 1
+        next_end = min(int((bucket + 2) * every) + 1, length)
+        next_points = points[next_start:next_end]
+        avg_x = sum(point[0] for point in next_points) / len(next_points)
+        avg_y = sum(point[1] for point in next_points) / len(next_points)
+
+        # Point of this bucket with the largest triangle
+        kept_x, kept_y = points[kept]
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        max_area = -1.0
+        for index in range(start, end):
+            x, y = points[index]
+            area = abs((kept_x - avg_x) * (y - kept_y) - (kept_x - x) * (avg_y - kept_y))
+            if area > max_area:
+                max_area = area
+                kept = index
+        sampled.append(points[kept])
+
+    sampled.append(points[-1])
+    return sampled
+
+
+def bucket_series(
+    timestamps: Sequence[int], values: Sequence[float], threshold: int
+) -> list[tuple[int, float, float, float]]:
+    """Downsample a series to min, max and mean of equal time buckets.
+
+    The bucket length is the shortest multiple of the data resolution
+    that needs no more than threshold buckets. Buckets are aligned to the
+    first timestamp, as aligning them to the epoch could split the range
+    into one bucket more.
+
+    Args:
+        timestamps: Sorted Unix timestamps in milliseconds
+        values: Values aligned with the timestamps, NaN for missing values
+        threshold: Maximum number of buckets to return
+
+    Returns:
+        (bucket start, min, max, mean) per bucket
+
+    """
+    if not timestamps or threshold < 1:
+        return []
+    span = timestamps[-1] - timestamps[0] + _RESOLUTION_MS
+    bucket_ms = math.ceil(span / threshold / _RESOLUTION_MS) * _RESOLUTION_MS
+    return bucket_range(timestamps, values, bucket_ms, timestamps[0])
+
+
+def downsample(
+    timestamps: Sequence[int],
+    values: Sequence[float],
+    threshold: int,
+    mode: str = DOWNSAMPLE_LTTB,
+) -> list[DownsampledPoint]:
+    """Downsample a series in the given mode.
+
+    Args:
+        timestamps: Sorted Unix timestamps in milliseconds
+        values: Values aligned with the timestamps, NaN for missing values
+        threshold: Maximum number of points to return
+        mode: "lttb" or "buckets"
+
+    Returns:
+        Downsampled points
+
+    Raises:
+        ValueError: The mode is unknown
+
+    """
+    if mode == DOWNSAMPLE_LTTB:
+        return lttb(timestamps, values, threshold)
+    if mode == DOWNSAMPLE_BUCKETS:
+        return bucket_series(timestamps, values, threshold)
+    raise ValueError(f"Unknown downsampling mode: {mode}")
@@ -0,0 +1,85 @@
+"""Forecast series of Energy-Charts responses."""
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from typing import Any
+
+from .const import DATA_RESOLUTION, FORECAST_HORIZONS, FORECAST_HOURS, SOURCE_CATEGORIES
+from .models import EnergyChartsResponse, is_forecast_key
+
+_HOUR_MS = 3_600_000
+_RESOLUTION_MS = int(DATA_RESOLUTION.total_seconds() * 1000)
+
+
+def forecast_base_key(key: str) -> str:
+    """Return the key of the source a forecast series predicts."""
+    return key.replace("_planned", "").replace("_forecast", "").strip("_")
+
+
+def _value_at(
+    timestamps: Sequence[int], data: Sequence[float], at_ms: int
+) -> float | None:
+    """Return the value of the quarter-hour containing a time, if valid."""
+    index = bisect_right(timestamps, at_ms) - 1
+    if index < 0 or index >= len(data) or at_ms >= timestamps[index] + _RESOLUTION_MS:
+        return None
+    value = data[index]
+    return round(value, 2) if value == value else None
+
+
+def extract_forecasts(
+    response: EnergyChartsResponse,
+    now_ms: int,
+    hours: int = FORECAST_HOURS,
+    horizons: Sequence[int] = FORECAST_HORIZONS,
+) -> dict[str, dict[str, Any]]:
+    """Index the forecast series of a response by horizon.
+
+    The forecast series ship in the same files as the measured series,
+    so this needs no request of its own. Lookups bisect the shared
+    timestamp array, so each forecast costs O(log n) plus the points of
+    the next hours.
+
+    Args:
+        response: Response decoded with its forecast series
+        now_ms: Current Unix time in milliseconds
+        hours: Number of hours listed ahead
+        horizons: Hours ahead to look up single values for
+
+    Returns:
+        Forecast data by forecast series key
+
+    """
+    timestamps = response.timestamps
+    start = max(bisect_right(timestamps, now_ms) - 1, 0)
+    end = bisect_right(timestamps, now_ms + hours * _HOUR_MS)
+    forecasts: dict[str, dict[str, Any]] = {}
+
+    for series in response.data_series:
+        key = series.key.lower()
+        if not is_forecast_key(key):
+            continue
+
+        data = series.data
+        base_key = forecast_base_key(key)
+        forecasts[key] = {
+            "key": key,
+            "source": base_key,
+            "name_en": series.name_en,
+            "name_de": series.name_de,
+            "color": series.color,
+            "category": SOURCE_CATEGORIES.get(base_key, "other"),
+            "value": _value_at(timestamps, data, now_ms),
+            "horizons": {
+                horizon: _value_at(timestamps, data, now_ms + horizon * _HOUR_MS)
+                for horizon in horizons
+            },
+            "next_hours": [
+                (timestamp, round(value, 2))
+                for timestamp, value in zip(timestamps[start:end], data[start:end])
+                if value == value
+            ],
+        }
+
+    return forecasts
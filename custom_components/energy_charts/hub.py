@@ -0,0 +1,110 @@
+"""Shared polling schedule for Energy-Charts entries in hub mode."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DATA_HUB, DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import EnergyChartsDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EnergyChartsHub:
+    """Refresh the coordinators of all hub-mode entries in one cycle.
+
+    Member coordinators have no timer of their own. On every tick the hub
+    refreshes all of them concurrently over the shared session, and each
+    coordinator then notifies its own entities. The tick interval is the
+    shortest interval configured by any member.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub.
+
+        Args:
+            hass: Home Assistant instance
+
+        """
+        self._hass = hass
+        self._members: dict[str, EnergyChartsDataUpdateCoordinator] = {}
+        self._interval: timedelta | None = None
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, coordinator: EnergyChartsDataUpdateCoordinator) -> CALLBACK_TYPE:
+        """Add a coordinator to the shared schedule.
+
+        Args:
+            coordinator: Coordinator of a hub-mode entry
+
+        Returns:
+            Callback that removes the coordinator again
+
+        """
+        self._members[coordinator.country] = coordinator
+        self._async_schedule()
+
+        @callback
+        def async_remove() -> None:
+            if self._members.get(coordinator.country) is coordinator:
+                del self._members[coordinator.country]
+                self._async_schedule()
+
+        return async_remove
+
+    @callback
+    def _async_schedule(self) -> None:
+        """(Re)start the timer with the shortest member interval."""
+        interval = min(
+            (member.poll_interval for member in self._members.values()),
+            default=None,
+        )
+        if interval == self._interval:
+            return
+
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._interval = interval
+
+        if interval is not None:
+            _LOGGER.debug(
+                "Polling %s every %s", ", ".join(sorted(self._members)), interval
+            )
+            self._unsub_timer = async_track_time_interval(
+                self._hass,
+                self._async_refresh_all,
+                interval,
+                name=f"{DOMAIN} hub refresh",
+                cancel_on_shutdown=True,
+            )
+
+    async def _async_refresh_all(self, _now: datetime | None = None) -> None:
+        """Refresh all member coordinators concurrently."""
+        members = list(self._members.values())
+        await asyncio.gather(*(member.async_refresh() for member in members))
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> EnergyChartsHub:
+    """Return the hub shared by all hub-mode entries.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Shared hub stored in hass.data
+
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (hub := domain_data.get(DATA_HUB)) is None:
+        hub = domain_data[DATA_HUB] = EnergyChartsHub(hass)
+    return hub
@@ -0,0 +1,130 @@
+"""Refresh timing and payload metrics for Energy-Charts."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import time
+from typing import Any
+
+# Timed stages
+STAGE_REQUEST = "request"
+STAGE_DECODE = "decode"
+STAGE_PROCESS = "process"
+STAGE_REFRESH = "refresh"
+STAGE_IMPORT = "import"
+
+
+@dataclass(slots=True)
+class StageTiming:
+    """Latency statistics of one stage in milliseconds."""
+
+    count: int = 0
+    last_ms: float | None = None
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def average_ms(self) -> float | None:
+        """Return the average latency."""
+        if not self.count:
+            return None
+        return self.total_ms / self.count
+
+    def record(self, elapsed_ms: float) -> None:
+        """Record one measurement."""
+        self.count += 1
+        self.last_ms = elapsed_ms
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+
+class EnergyChartsMetrics:
+    """Counters and stage latencies of one country's requests and refreshes.
+
+    Stages:
+        request: Whole request including retries, download and decoding
+        decode: CPU time spent decoding the response body
+        process: Building the sensor data from the decoded responses
+        refresh: Whole coordinator refresh
+        import: Importing the integration modules when the entry was set
+            up; close to zero when another entry already imported them
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.stages: dict[str, StageTiming] = {}
+        self.requests = 0
+        self.retries = 0
+        self.bytes_received = 0
+        self.last_payload_bytes: int | None = None
+        self.cache_hits = 0
+        self.not_modified = 0
+        self.downloads = 0
+
+    def record(self, stage: str, elapsed_ms: float) -> None:
+        """Record the latency of a stage.
+
+        Args:
+            stage: Stage name
+            elapsed_ms: Elapsed time in milliseconds
+
+        """
+        if (timing := self.stages.get(stage)) is None:
+            timing = self.stages[stage] = StageTiming()
+        timing.record(elapsed_ms)
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as a stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, (time.perf_counter() - start) * 1000)
+
+    def last_ms(self, stage: str) -> float | None:
+        """Return the latest latency of a stage."""
+        if (timing := self.stages.get(stage)) is None:
+            return None
+        return timing.last_ms
+
+    def record_download(self, payload_bytes: int) -> None:
+        """Record a fully downloaded response body."""
+        self.downloads += 1
+        self.bytes_received += payload_bytes
+        self.last_payload_bytes = payload_bytes
+
+    @property
+    def cache_hit_ratio(self) -> float | None:
+        """Return the share of lookups served without a download, in percent.
+
+        Both fresh cache entries and 304 Not Modified answers count as hits.
+        """
+        hits = self.cache_hits + self.not_modified
+        lookups = hits + self.downloads
+        if not lookups:
+            return None
+        return hits / lookups * 100
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all metrics as plain data, e.g. for diagnostics."""
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "downloads": self.downloads,
+            "bytes_received": self.bytes_received,
+            "last_payload_bytes": self.last_payload_bytes,
+            "cache_hits": self.cache_hits,
+            "not_modified": self.not_modified,
+            "cache_hit_ratio": self.cache_hit_ratio,
+            "stages": {
+                stage: {
+                    "count": timing.count,
+                    "last_ms": timing.last_ms,
+                    "average_ms": timing.average_ms,
+                    "max_ms": timing.max_ms,
+                }
+                for stage, timing in self.stages.items()
+            },
+        }
@@ -1,46 +1,130 @@
 """Data models for Energy-Charts API."""
 from __future__ import annotations
 
-from datetime import datetime
+from array import array
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime, timedelta
+import math
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
 
+NAN = math.nan
 
-class EnergyDataSeries(BaseModel):
-    """Represents a single energy data series from the API."""
+# Time-series point with a Unix timestamp in milliseconds
+Point = tuple[int, float]
 
-    name: dict[str, str] = Field(..., description="Multilingual name dictionary")
-    color: str = Field(..., description="RGB color code")
-    data: list[float | None] = Field(
-        default_factory=list, description="Time series data values"
-    )
-    timestamps: list[int] = Field(
-        default_factory=list, description="Unix timestamps in milliseconds"
+
+def to_datetime(timestamp_ms: int) -> datetime:
+    """Convert a Unix timestamp in milliseconds to an aware UTC datetime."""
+    return datetime.fromtimestamp(timestamp_ms / 1000, UTC)
+
+
+def to_datetimes(timestamps_ms: Iterable[int]) -> list[datetime]:
+    """Convert many sorted Unix timestamps in milliseconds at once.
+
+    Consecutive timestamps are mostly one resolution step apart, so every
+    datetime after the first is derived from its predecessor by adding a
+    cached step, which is several times faster than one conversion each.
+    """
+    datetimes: list[datetime] = []
+    steps: dict[int, timedelta] = {}
+    previous_ms: int | None = None
+    previous: datetime | None = None
+
+    for timestamp_ms in timestamps_ms:
+        if previous is None or previous_ms is None:
+            current = to_datetime(timestamp_ms)
+        else:
+            delta = timestamp_ms - previous_ms
+            if (step := steps.get(delta)) is None:
+                step = steps[delta] = timedelta(milliseconds=delta)
+            current = previous + step
+        datetimes.append(current)
+        previous_ms = timestamp_ms
+        previous = current
+
+    return datetimes
+
+
+def to_float_array(values: Iterable[float | None]) -> array[float]:
+    """Convert raw values to a float64 array with NaN for missing values."""
+    return array("d", [NAN if value is None else value for value in values])
+
+
+def normalize_name(name: dict[str, str] | list[dict[str, str]] | None) -> dict[str, str]:
+    """Normalize the name field - handle both dict and list[dict] formats.
+
+    The API inconsistently returns name as either:
+    - dict: {"en": "...", "de": "...", ...}
+    - list: [{"en": "...", "de": "...", ...}]
+    """
+    if isinstance(name, list) and len(name) > 0:
+        return name[0]
+    if isinstance(name, dict):
+        return name
+    return {}
+
+
+def series_key(name_en: str) -> str:
+    """Generate a unique snake_case key from an English series name."""
+    name = name_en.lower()
+    # Replace special characters and spaces
+    key = (
+        name.replace(" ", "_")
+        .replace("/", "_")
+        .replace("-", "_")
+        .replace("(", "")
+        .replace(")", "")
+        .replace(",", "")
     )
-    visible: bool = Field(default=True, description="Whether series is visible")
+    # Remove duplicate underscores
+    while "__" in key:
+        key = key.replace("__", "_")
+    return key.strip("_")
 
-    @field_validator("name", mode="before")
-    @classmethod
-    def normalize_name(cls, v: dict | list) -> dict:
-        """Normalize name field - handle both dict and list[dict] formats.
 
-        The API inconsistently returns name as either:
-        - dict: {"en": "...", "de": "...", ...}
-        - list: [{"en": "...", "de": "...", ...}]
+def is_forecast_key(key: str) -> bool:
+    """Return whether a series key denotes a forecast series."""
+    # Forecast series typically have a "_planned" suffix
+    return "_planned" in key or "forecast" in key
 
-        This validator normalizes to always return a dict.
-        """
-        if isinstance(v, list) and len(v) > 0:
-            return v[0]
-        if isinstance(v, dict):
-            return v
-        return {}
 
-    class Config:
-        """Pydantic config."""
+class EnergyDataSeries:
+    """Represents a single energy data series from the API.
+
+    Values are stored column-wise in a float64 array with NaN marking
+    missing values. The timestamps array is shared by all series of a
+    response instead of being copied per series.
+    """
+
+    __slots__ = ("name", "color", "data", "timestamps", "visible", "_key")
 
-        populate_by_name = True
+    def __init__(
+        self,
+        name: dict[str, str] | list[dict[str, str]],
+        color: str = "#000000",
+        data: Iterable[float | None] = (),
+        timestamps: Sequence[int] = (),
+        visible: bool = True,
+    ) -> None:
+        """Initialize the series.
+
+        Args:
+            name: Multilingual name dictionary
+            color: RGB color code
+            data: Time series data values, None or NaN for missing values
+            timestamps: Unix timestamps in milliseconds
+            visible: Whether series is visible
+
+        """
+        self.name = normalize_name(name)
+        self._key = series_key(self.name_en)
+        self.color = color
+        self.data = data if isinstance(data, array) else to_float_array(data)
+        self.timestamps = (
+            timestamps if isinstance(timestamps, array) else array("q", timestamps)
+        )
+        self.visible = visible
 
     @property
     def name_en(self) -> str:
@@ -54,68 +138,85 @@ class EnergyDataSeries(BaseModel):
 
     @property
     def key(self) -> str:
-        """Generate a unique key from the English name."""
-        # Convert name to snake_case key
-        name = self.name_en.lower()
-        # Replace special characters and spaces
-        key = (
-            name.replace(" ", "_")
-            .replace("/", "_")
-            .replace("-", "_")
-            .replace("(", "")
-            .replace(")", "")
-            .replace(",", "")
-        )
-        # Remove duplicate underscores
-        while "__" in key:
-            key = key.replace("__", "_")
-        return key.strip("_")
+        """Get the unique key generated from the English name."""
+        return self._key
+
+    def _latest_index(self) -> int | None:
+        """Get the index of the most recent non-null value."""
+        data = self.data
+        for i in range(len(data) - 1, -1, -1):
+            # NaN is the only value not equal to itself
+            if data[i] == data[i]:
+                return i
+        return None
 
     @property
     def latest_value(self) -> float | None:
         """Get the most recent non-null value."""
-        for value in reversed(self.data):
-            if value is not None:
-                return float(value)
-        return None
+        index = self._latest_index()
+        if index is None:
+            return None
+        return self.data[index]
 
     @property
     def latest_timestamp(self) -> datetime | None:
         """Get the timestamp of the most recent non-null value."""
-        if not self.timestamps or not self.data:
+        index = self._latest_index()
+        if index is None or index >= len(self.timestamps):
             return None
+        return to_datetime(self.timestamps[index])
 
-        # Find the last non-null value and its index
-        for i in range(len(self.data) - 1, -1, -1):
-            if self.data[i] is not None and i < len(self.timestamps):
-                return datetime.fromtimestamp(self.timestamps[i] / 1000)
-        return None
+    def get_values(self) -> list[float | None]:
+        """Get the raw values with None for missing values."""
+        return [value if value == value else None for value in self.data]
 
     def get_values_as_dict(self) -> dict[datetime, float]:
         """Convert data to dict with datetime keys and float values."""
-        result = {}
-        for i, value in enumerate(self.data):
-            if value is not None and i < len(self.timestamps):
-                timestamp = datetime.fromtimestamp(self.timestamps[i] / 1000)
-                result[timestamp] = float(value)
-        return result
+        return dict(self.get_data_points())
+
+    def get_points(self) -> list[Point]:
+        """Get data as list of (Unix timestamp in ms, value) tuples."""
+        return [
+            (ts, value) for ts, value in zip(self.timestamps, self.data) if value == value
+        ]
 
     def get_data_points(self) -> list[tuple[datetime, float]]:
-        """Get data as list of (timestamp, value) tuples."""
-        result = []
-        for i, value in enumerate(self.data):
-            if value is not None and i < len(self.timestamps):
-                timestamp = datetime.fromtimestamp(self.timestamps[i] / 1000)
-                result.append((timestamp, float(value)))
-        return result
+        """Get data as list of (aware UTC datetime, value) tuples."""
+        points = self.get_points()
+        return list(zip(to_datetimes(ts for ts, _ in points), (v for _, v in points)))
 
 
-class EnergyChartsResponse(BaseModel):
-    """Complete response from Energy-Charts API."""
+class EnergyChartsResponse:
+    """Complete response from Energy-Charts API.
 
-    data_series: list[EnergyDataSeries] = Field(
-        default_factory=list, description="List of energy data series"
-    )
+    Lookup indexes by key and by per-language name are built once at
+    construction; data_series must not be modified afterwards.
+    """
+
+    __slots__ = ("data_series", "timestamps", "_by_key", "_by_name")
+
+    def __init__(
+        self,
+        data_series: list[EnergyDataSeries] | None = None,
+        timestamps: array[int] | None = None,
+    ) -> None:
+        """Initialize the response.
+
+        Args:
+            data_series: List of energy data series
+            timestamps: Unix timestamps in milliseconds shared by all series
+
+        """
+        self.data_series = data_series if data_series is not None else []
+        self.timestamps = timestamps if timestamps is not None else array("q")
+
+        # First series wins, matching a linear scan
+        self._by_key: dict[str, EnergyDataSeries] = {}
+        self._by_name: dict[str, dict[str, EnergyDataSeries]] = {}
+        for series in reversed(self.data_series):
+            self._by_key[series.key] = series
+            for language, name in series.name.items():
+                self._by_name.setdefault(language, {})[name.lower()] = series
 
     @classmethod
     def from_api_response(cls, response_data: list[dict[str, Any]]) -> EnergyChartsResponse:
@@ -125,10 +226,10 @@ class EnergyChartsResponse(BaseModel):
         xAxisValues (timestamps) that apply to all series.
         """
         if not response_data:
-            return cls(data_series=[])
+            return cls()
 
         # Extract timestamps from the first item (they apply to all series)
-        timestamps = response_data[0].get("xAxisValues", [])
+        timestamps = array("q", response_data[0].get("xAxisValues", []))
 
         # Parse each series
         data_series = []
@@ -137,49 +238,58 @@ class EnergyChartsResponse(BaseModel):
             if "name" not in item or "data" not in item:
                 continue
 
-            # Create series with timestamps
+            # Create series sharing the response timestamps
             series = EnergyDataSeries(
                 name=item["name"],
                 color=item.get("color", "#000000"),
-                data=item.get("data", []),
+                data=to_float_array(item["data"] or ()),
                 timestamps=timestamps,
                 visible=item.get("visible", True),
             )
             data_series.append(series)
 
-        return cls(data_series=data_series)
+        return cls(data_series=data_series, timestamps=timestamps)
+
+    def to_compact(self) -> dict[str, Any]:
+        """Serialize to a compact JSON-compatible form for persistence.
+
+        The shared timestamps are stored once instead of per series.
+        """
+        return {
+            "x": self.timestamps.tolist(),
+            "s": [
+                [series.name, series.color, series.visible, series.get_values()]
+                for series in self.data_series
+            ],
+        }
+
+    @classmethod
+    def from_compact(cls, compact: dict[str, Any]) -> EnergyChartsResponse:
+        """Create instance from the form produced by to_compact."""
+        timestamps = array("q", compact.get("x", []))
+        return cls(
+            data_series=[
+                EnergyDataSeries(
+                    name=name,
+                    color=color,
+                    data=to_float_array(data),
+                    timestamps=timestamps,
+                    visible=visible,
+                )
+                for name, color, visible, data in compact.get("s", [])
+            ],
+            timestamps=timestamps,
+        )
 
     def get_series_by_key(self, key: str) -> EnergyDataSeries | None:
         """Get a specific data series by its key."""
-        for series in self.data_series:
-            if series.key == key:
-                return series
-        return None
+        return self._by_key.get(key)
 
     def get_series_by_name(self, name: str, language: str = "en") -> EnergyDataSeries | None:
         """Get a specific data series by its name."""
-        for series in self.data_series:
-            if series.name.get(language, "").lower() == name.lower():
-                return series
-        return None
+        return self._by_name.get(language, {}).get(name.lower())
 
     def get_series_keys(self) -> list[str]:
         """Get all available data series keys."""
         return [series.key for series in self.data_series]
 
-
-class CoordinatorData(BaseModel):
-    """Structured data provided by the coordinator to sensors."""
-
-    timestamp: datetime = Field(default_factory=datetime.now)
-    raw_response: EnergyChartsResponse
-    sources: dict[str, dict[str, Any]] = Field(default_factory=dict)
-    aggregated: dict[str, float] = Field(default_factory=dict)
-    categories: dict[str, float] = Field(default_factory=dict)
-    history: dict[str, list[tuple[datetime, float]]] = Field(default_factory=dict)
-    forecasts: dict[str, list[tuple[datetime, float]]] = Field(default_factory=dict)
-
-    class Config:
-        """Pydantic config."""
-
-        arbitrary_types_allowed = True
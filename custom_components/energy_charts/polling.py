@@ -0,0 +1,105 @@
+"""Publication-aware polling schedule for Energy-Charts."""
+from __future__ import annotations
+
+from collections import deque
+from datetime import timedelta
+
+from .const import (
+    ADAPTIVE_LAG_PRECISION,
+    ADAPTIVE_LAG_SAMPLES,
+    ADAPTIVE_MARGIN,
+    ADAPTIVE_MIN_INTERVAL,
+    DATA_RESOLUTION,
+)
+
+_RESOLUTION_MS = int(DATA_RESOLUTION.total_seconds() * 1000)
+_PRECISION_MS = int(ADAPTIVE_LAG_PRECISION.total_seconds() * 1000)
+_MIN_INTERVAL_MS = int(ADAPTIVE_MIN_INTERVAL.total_seconds() * 1000)
+_MARGIN_MS = int(ADAPTIVE_MARGIN.total_seconds() * 1000)
+
+
+class AdaptivePollSchedule:
+    """Work out when the next quarter-hour point is expected to be published.
+
+    A point labelled T covers the quarter-hour from T and is published a
+    lag after that quarter-hour ended. Each poll brackets the lag: a poll
+    that sees a new point gives an upper bound, a poll after the end of a
+    quarter-hour that does not see its point gives a lower bound. The next
+    poll is aimed between the recent bounds until they are closer than the
+    precision, and a margin after the upper bound from then on. Between
+    publications there is no poll at all, however short the configured
+    interval.
+
+    While an expected point is overdue, the interval doubles from the
+    minimum interval up to the configured interval.
+    """
+
+    def __init__(self, max_interval: timedelta) -> None:
+        """Initialize the schedule.
+
+        Args:
+            max_interval: Longest interval between two polls while the lag
+                is unknown or a point is overdue
+
+        """
+        self._max_interval_ms = max(
+            int(max_interval.total_seconds() * 1000), _MIN_INTERVAL_MS
+        )
+        self._upper: deque[int] = deque(maxlen=ADAPTIVE_LAG_SAMPLES)
+        self._lower: deque[int] = deque(maxlen=ADAPTIVE_LAG_SAMPLES)
+        self._latest_ms: int | None = None
+        self._backoff_ms: int | None = None
+
+    @property
+    def publication_lag(self) -> timedelta | None:
+        """Return the estimated publication lag, if known."""
+        if not self._upper:
+            return None
+        return timedelta(milliseconds=min(self._upper))
+
+    def _estimate(self) -> int | None:
+        """Return the lag to aim the next poll at, in milliseconds."""
+        if not self._upper:
+            return None
+        upper = min(self._upper)
+        lower = min(max(self._lower, default=0), upper)
+        if upper - lower > _PRECISION_MS:
+            return (lower + upper) // 2
+        return upper + _MARGIN_MS
+
+    def next_interval(self, latest_ms: int | None, now_ms: int) -> timedelta:
+        """Record the outcome of a poll and return the interval to the next.
+
+        Args:
+            latest_ms: Timestamp of the newest published point, if any
+            now_ms: Current Unix time in milliseconds
+
+        Returns:
+            Interval until the next poll
+
+        """
+        if latest_ms is not None and (
+            self._latest_ms is None or latest_ms > self._latest_ms
+        ):
+            self._upper.append(max(now_ms - (latest_ms + _RESOLUTION_MS), 0))
+            self._latest_ms = latest_ms
+            self._backoff_ms = None
+        elif self._latest_ms is not None:
+            # The quarter-hour after the latest point may have ended unpublished
+            missed = now_ms - (self._latest_ms + 2 * _RESOLUTION_MS)
+            if missed > 0:
+                self._lower.append(missed)
+
+        if self._latest_ms is None or (lag := self._estimate()) is None:
+            return timedelta(milliseconds=self._max_interval_ms)
+
+        expected_ms = self._latest_ms + 2 * _RESOLUTION_MS + lag
+        if expected_ms <= now_ms:
+            # The next point is overdue, poll again with growing intervals
+            if self._backoff_ms is None:
+                self._backoff_ms = _MIN_INTERVAL_MS
+            else:
+                self._backoff_ms = min(self._backoff_ms * 2, self._max_interval_ms)
+            return timedelta(milliseconds=self._backoff_ms)
+
+        return timedelta(milliseconds=max(expected_ms - now_ms, _MIN_INTERVAL_MS))
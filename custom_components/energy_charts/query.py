@@ -0,0 +1,103 @@
+"""Time-range queries over the in-memory Energy-Charts series."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+
+from .aggregation import AggregatedSeries
+from .models import EnergyChartsResponse
+
+
+def find_series(
+    response: EnergyChartsResponse,
+    aggregated: AggregatedSeries | None,
+    key: str,
+) -> Sequence[float] | None:
+    """Return the values of a source or aggregate by key.
+
+    Args:
+        response: Response holding the source series
+        aggregated: Aggregate series computed from the response
+        key: Source key (e.g. "solar") or aggregate key (e.g. "total_production")
+
+    Returns:
+        Values aligned with the response timestamps, or None if unknown
+
+    """
+    if (series := response.get_series_by_key(key)) is not None:
+        return series.data
+    if aggregated is not None:
+        return aggregated.get(key)
+    return None
+
+
+def slice_range(
+    timestamps: Sequence[int],
+    values: Sequence[float],
+    start_ms: int | None = None,
+    end_ms: int | None = None,
+) -> tuple[Sequence[int], Sequence[float]]:
+    """Slice a series to a time range by bisecting the sorted timestamps.
+
+    Args:
+        timestamps: Sorted Unix timestamps in milliseconds
+        values: Values aligned with the timestamps
+        start_ms: First timestamp to include, unbounded if None
+        end_ms: Last timestamp to include, unbounded if None
+
+    Returns:
+        Timestamps and values within the range
+
+    """
+    start = 0 if start_ms is None else bisect_left(timestamps, start_ms)
+    end = len(timestamps) if end_ms is None else bisect_right(timestamps, end_ms)
+    end = min(end, len(values))
+    return timestamps[start:end], values[start:end]
+
+
+def bucket_range(
+    timestamps: Sequence[int],
+    values: Sequence[float],
+    bucket_ms: int,
+    origin_ms: int = 0,
+) -> list[tuple[int, float, float, float]]:
+    """Reduce a series to the min, max and mean of fixed time buckets.
+
+    Buckets are aligned to multiples of their length since the origin,
+    the epoch by default. Missing values are skipped, and buckets without
+    any value are left out.
+
+    Args:
+        timestamps: Sorted Unix timestamps in milliseconds
+        values: Values aligned with the timestamps
+        bucket_ms: Bucket length in milliseconds
+        origin_ms: Unix timestamp in milliseconds the buckets are aligned to
+
+    Returns:
+        (bucket start, min, max, mean) per bucket
+
+    """
+    buckets: list[tuple[int, float, float, float]] = []
+    current: int | None = None
+    low = high = total = 0.0
+    count = 0
+
+    for timestamp, value in zip(timestamps, values):
+        if value != value:
+            continue
+        start = timestamp - (timestamp - origin_ms) % bucket_ms
+        if start != current:
+            if count:
+                buckets.append((current, low, high, total / count))
+            current = start
+            low = high = total = value
+            count = 1
+            continue
+        low = min(low, value)
+        high = max(high, value)
+        total += value
+        count += 1
+
+    if count:
+        buckets.append((current, low, high, total / count))
+    return buckets
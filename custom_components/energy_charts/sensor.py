@@ -1,17 +1,20 @@
 """Sensor platform for Energy-Charts integration."""
 from __future__ import annotations
 
-from datetime import datetime
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 import logging
 from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -24,7 +27,10 @@ from .const import (
     ATTR_DAILY_AVERAGE,
     ATTR_DAILY_PEAK,
     ATTR_DATA_SOURCE,
+    ATTR_FORECAST,
+    ATTR_FORECAST_SOURCE,
     ATTR_HISTORY_TODAY,
+    ATTR_IS_FORECAST,
     ATTR_LAST_VALUE_TIMESTAMP,
     ATTR_SOURCE_ID,
     ATTR_SOURCE_NAME_DE,
@@ -32,6 +38,7 @@ from .const import (
     CONF_COUNTRY,
     CONF_ENABLE_AGGREGATED,
     CONF_ENABLE_CATEGORIES,
+    CONF_ENABLE_FORECASTS,
     CONF_ENABLE_INDIVIDUAL,
     DATA_SOURCE_ATTRIBUTION,
     DATA_SOURCE_URL,
@@ -52,11 +59,31 @@ from .const import (
     UNIT_MEGAWATT,
     UNIT_PERCENT,
 )
-from .coordinator import EnergyChartsDataUpdateCoordinator
+from .coordinator import DataKey, EnergyChartsDataUpdateCoordinator
+from .metrics import (
+    STAGE_DECODE,
+    STAGE_PROCESS,
+    STAGE_REFRESH,
+    STAGE_REQUEST,
+    EnergyChartsMetrics,
+)
+from .models import Point, to_datetimes
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _format_points(points: Sequence[Point]) -> list[tuple[str, float]]:
+    """Format (Unix timestamp in ms, value) points as attribute values.
+
+    Datetimes are only built here, for the points actually published.
+    """
+    datetimes = to_datetimes(timestamp for timestamp, _ in points)
+    return [
+        (moment.isoformat(), round(value, 2))
+        for moment, (_, value) in zip(datetimes, points)
+    ]
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -76,10 +103,7 @@ async def async_setup_entry(
     entities: list[SensorEntity] = []
 
     # Individual source sensors
-    if entry.data.get(CONF_ENABLE_INDIVIDUAL, True):
-        # Wait for first data update
-        await coordinator.async_config_entry_first_refresh()
-
+    if coordinator.config.get(CONF_ENABLE_INDIVIDUAL, True):
         for source_key in coordinator.data.get("sources", {}).keys():
             entities.append(
                 EnergyChartsSourceSensor(
@@ -90,7 +114,7 @@ async def async_setup_entry(
             )
 
     # Aggregated sensors
-    if entry.data.get(CONF_ENABLE_AGGREGATED, True):
+    if coordinator.config.get(CONF_ENABLE_AGGREGATED, True):
         entities.extend(
             [
                 EnergyChartsTotalProductionSensor(coordinator, entry),
@@ -102,7 +126,7 @@ async def async_setup_entry(
         )
 
     # Category sensors
-    if entry.data.get(CONF_ENABLE_CATEGORIES, True):
+    if coordinator.config.get(CONF_ENABLE_CATEGORIES, True):
         entities.extend(
             [
                 EnergyChartsSolarTotalSensor(coordinator, entry),
@@ -112,6 +136,23 @@ async def async_setup_entry(
             ]
         )
 
+    # Forecast sensors
+    if coordinator.config.get(CONF_ENABLE_FORECASTS, False):
+        for forecast_key in coordinator.data.get("forecasts", {}).keys():
+            entities.append(
+                EnergyChartsForecastSensor(
+                    coordinator=coordinator,
+                    entry=entry,
+                    forecast_key=forecast_key,
+                )
+            )
+
+    # Diagnostic sensors
+    entities.extend(
+        EnergyChartsMetricSensor(coordinator, entry, description)
+        for description in METRIC_SENSORS
+    )
+
     async_add_entities(entities)
 
 
@@ -137,6 +178,45 @@ class EnergyChartsBaseSensor(CoordinatorEntity[EnergyChartsDataUpdateCoordinator
         self._entry = entry
         self._country = entry.data[CONF_COUNTRY]
         self._country_name = SUPPORTED_COUNTRIES.get(self._country, self._country.upper())
+        self._attributes: dict[str, Any] = {}
+        self._attributes_data: dict[str, Any] | None = None
+        self._written_state: tuple[Any, ...] | None = None
+
+    def _listen_to(self, *keys: DataKey) -> None:
+        """Only handle coordinator updates that change the given data keys.
+
+        Args:
+            keys: (section, key) pairs of the coordinator data that are read
+
+        """
+        self.coordinator_context = frozenset({("derived", "api_url"), *keys})
+
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        """Return everything a state write would publish."""
+        return (
+            self.available,
+            self.name,
+            self.native_value,
+            self.extra_state_attributes,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the initial state written when the entity is added."""
+        await super().async_added_to_hass()
+        self._written_state = self._state_snapshot()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if it changed since the last write.
+
+        Refreshes that bring no new data would otherwise write identical
+        states for every entity and add rows to the recorder.
+        """
+        snapshot = self._state_snapshot()
+        if snapshot == self._written_state:
+            return
+        self._written_state = snapshot
+        self.async_write_ha_state()
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -152,16 +232,23 @@ class EnergyChartsBaseSensor(CoordinatorEntity[EnergyChartsDataUpdateCoordinator
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        # Generate current API URL dynamically
-        now = datetime.now()
-        year, week, _ = now.isocalendar()
-        api_url = f"https://www.energy-charts.info/charts/power/data/{self._country}/week_{year}_{week:02d}.json"
+        """Return additional state attributes.
 
+        The attributes are built once per coordinator data version and
+        returned as is on every further state write.
+        """
+        data = self.coordinator.data
+        if self._attributes_data is not data:
+            self._attributes = self._build_attributes()
+            self._attributes_data = data
+        return self._attributes
+
+    def _build_attributes(self) -> dict[str, Any]:
+        """Build the additional state attributes from the coordinator data."""
         return {
             ATTR_DATA_SOURCE: DATA_SOURCE_ATTRIBUTION,
             ATTR_COUNTRY: self._country.upper(),
-            ATTR_API_URL: api_url,
+            ATTR_API_URL: self.coordinator.data.get("derived", {}).get("api_url"),
         }
 
 
@@ -172,6 +259,11 @@ class EnergyChartsSourceSensor(EnergyChartsBaseSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UNIT_MEGAWATT
 
+    # History is imported as long-term statistics instead
+    _unrecorded_attributes = frozenset(
+        {ATTR_DAILY_AVERAGE, ATTR_DAILY_PEAK, ATTR_HISTORY_TODAY}
+    )
+
     def __init__(
         self,
         coordinator: EnergyChartsDataUpdateCoordinator,
@@ -191,6 +283,7 @@ class EnergyChartsSourceSensor(EnergyChartsBaseSensor):
 
         # Set unique ID
         self._attr_unique_id = f"{DOMAIN}_{self._country}_{source_key}"
+        self._listen_to(("sources", source_key), ("history", source_key))
 
         # Set icon based on source type
         icon_key = source_key
@@ -216,10 +309,9 @@ class EnergyChartsSourceSensor(EnergyChartsBaseSensor):
             return round(value, 2)
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        attrs = super().extra_state_attributes
+    def _build_attributes(self) -> dict[str, Any]:
+        """Build the additional state attributes from the coordinator data."""
+        attrs = super()._build_attributes()
 
         source_data = self.coordinator.data.get("sources", {}).get(self._source_key, {})
 
@@ -241,15 +333,97 @@ class EnergyChartsSourceSensor(EnergyChartsBaseSensor):
         # Add historical data if available
         history = self.coordinator.data.get("history", {}).get(self._source_key, [])
         if history:
-            # Calculate daily statistics
-            values = [val for _, val in history]
-            if values:
-                attrs[ATTR_DAILY_PEAK] = round(max(values), 2)
-                attrs[ATTR_DAILY_AVERAGE] = round(sum(values) / len(values), 2)
-                # Store recent history (last 10 points)
-                attrs[ATTR_HISTORY_TODAY] = [
-                    (ts.isoformat(), round(val, 2)) for ts, val in history[-10:]
-                ]
+            # Daily statistics are maintained incrementally by the coordinator
+            stats = self.coordinator.data.get("history_stats", {}).get(
+                self._source_key, {}
+            )
+            if stats.get("peak") is not None:
+                attrs[ATTR_DAILY_PEAK] = round(stats["peak"], 2)
+                attrs[ATTR_DAILY_AVERAGE] = round(stats["average"], 2)
+            # Store recent history (last 10 points)
+            attrs[ATTR_HISTORY_TODAY] = _format_points(history[-10:])
+
+        return attrs
+
+
+class EnergyChartsForecastSensor(EnergyChartsBaseSensor):
+    """Sensor for a forecast series, e.g. planned solar production."""
+
+    _attr_device_class = SensorDeviceClass.POWER
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UNIT_MEGAWATT
+
+    # The upcoming points change with every refresh and are not worth recording
+    _unrecorded_attributes = frozenset({ATTR_FORECAST})
+
+    def __init__(
+        self,
+        coordinator: EnergyChartsDataUpdateCoordinator,
+        entry: ConfigEntry,
+        forecast_key: str,
+    ) -> None:
+        """Initialize the forecast sensor.
+
+        Args:
+            coordinator: Data update coordinator
+            entry: Config entry
+            forecast_key: Forecast series key (e.g., "solar_planned")
+
+        """
+        super().__init__(coordinator, entry)
+        self._forecast_key = forecast_key
+
+        self._attr_unique_id = f"{DOMAIN}_{self._country}_{forecast_key}"
+        self._listen_to(("forecasts", forecast_key))
+
+        source_key = self._forecast.get("source", forecast_key)
+        icon_key = source_key
+        for key in SOURCE_ICONS:
+            if key in source_key:
+                icon_key = key
+                break
+        self._attr_icon = SOURCE_ICONS.get(icon_key, "mdi:crystal-ball")
+
+    @property
+    def _forecast(self) -> dict[str, Any]:
+        """Return the forecast data of this sensor."""
+        return self.coordinator.data.get("forecasts", {}).get(self._forecast_key, {})
+
+    @property
+    def name(self) -> str:
+        """Return the name of the sensor."""
+        return self._forecast.get(
+            "name_en", self._forecast_key.replace("_", " ").title()
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the forecast for the current quarter-hour."""
+        return self._forecast.get("value")
+
+    def _build_attributes(self) -> dict[str, Any]:
+        """Build the additional state attributes from the coordinator data."""
+        attrs = super()._build_attributes()
+
+        forecast = self._forecast
+
+        attrs.update(
+            {
+                ATTR_SOURCE_ID: self._forecast_key,
+                ATTR_SOURCE_NAME_EN: forecast.get("name_en", ""),
+                ATTR_SOURCE_NAME_DE: forecast.get("name_de", ""),
+                ATTR_COLOR: forecast.get("color", ""),
+                ATTR_CATEGORY: forecast.get("category", ""),
+                ATTR_FORECAST_SOURCE: forecast.get("source", ""),
+                ATTR_IS_FORECAST: True,
+            }
+        )
+
+        # Forecast values a fixed number of hours ahead, e.g. in_3h
+        for horizon, value in forecast.get("horizons", {}).items():
+            attrs[f"in_{horizon}h"] = value
+
+        attrs[ATTR_FORECAST] = _format_points(forecast.get("next_hours", []))
 
         return attrs
 
@@ -270,6 +444,11 @@ class EnergyChartsTotalProductionSensor(EnergyChartsBaseSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{DOMAIN}_{self._country}_{SENSOR_TOTAL_PRODUCTION}"
+        self._listen_to(
+            ("aggregated", SENSOR_TOTAL_PRODUCTION),
+            ("derived", "source_count"),
+            ("derived", "top_sources"),
+        )
         self._attr_name = "Total Production"
 
     @property
@@ -277,26 +456,16 @@ class EnergyChartsTotalProductionSensor(EnergyChartsBaseSensor):
         """Return the state of the sensor."""
         return self.coordinator.data.get("aggregated", {}).get(SENSOR_TOTAL_PRODUCTION)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        attrs = super().extra_state_attributes
-
-        sources = self.coordinator.data.get("sources", {})
-        source_count = len([s for s in sources.values() if s.get("value", 0) > 0])
+    def _build_attributes(self) -> dict[str, Any]:
+        """Build the additional state attributes from the coordinator data."""
+        attrs = super()._build_attributes()
 
-        # Get top 5 sources
-        sources_with_values = [
-            (data.get("name_en", key), data.get("value", 0))
-            for key, data in sources.items()
-            if data.get("value", 0) > 0
-        ]
-        top_sources = sorted(sources_with_values, key=lambda x: x[1], reverse=True)[:5]
+        derived = self.coordinator.data.get("derived", {})
 
         attrs.update(
             {
-                "source_count": source_count,
-                "top_5_sources": [[name, round(val, 2)] for name, val in top_sources],
+                "source_count": derived.get("source_count", 0),
+                "top_5_sources": derived.get("top_sources", []),
             }
         )
 
@@ -319,6 +488,11 @@ class EnergyChartsTotalRenewableSensor(EnergyChartsBaseSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{DOMAIN}_{self._country}_{SENSOR_TOTAL_RENEWABLE}"
+        self._listen_to(
+            ("aggregated", SENSOR_TOTAL_RENEWABLE),
+            ("aggregated", SENSOR_TOTAL_PRODUCTION),
+            ("derived", "renewable_sources"),
+        )
         self._attr_name = "Renewable Production"
 
     @property
@@ -326,17 +500,11 @@ class EnergyChartsTotalRenewableSensor(EnergyChartsBaseSensor):
         """Return the state of the sensor."""
         return self.coordinator.data.get("aggregated", {}).get(SENSOR_TOTAL_RENEWABLE)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        attrs = super().extra_state_attributes
+    def _build_attributes(self) -> dict[str, Any]:
+        """Build the additional state attributes from the coordinator data."""
+        attrs = super()._build_attributes()
 
-        sources = self.coordinator.data.get("sources", {})
-        renewable_sources = [
-            (data.get("name_en", key), data.get("value", 0))
-            for key, data in sources.items()
-            if data.get("category") == "renewable" and data.get("value", 0) > 0
-        ]
+        derived = self.coordinator.data.get("derived", {})
 
         total_production = self.coordinator.data.get("aggregated", {}).get(
             SENSOR_TOTAL_PRODUCTION, 0
@@ -351,7 +519,7 @@ class EnergyChartsTotalRenewableSensor(EnergyChartsBaseSensor):
 
         attrs.update(
             {
-                "sources": [name for name, _ in renewable_sources],
+                "sources": derived.get("renewable_sources", []),
                 "share_of_total": round(share, 2),
             }
         )
@@ -374,6 +542,11 @@ class EnergyChartsRenewableShareSensor(EnergyChartsBaseSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{DOMAIN}_{self._country}_{SENSOR_RENEWABLE_SHARE}"
+        self._listen_to(
+            ("aggregated", SENSOR_RENEWABLE_SHARE),
+            ("aggregated", SENSOR_TOTAL_RENEWABLE),
+            ("aggregated", SENSOR_TOTAL_PRODUCTION),
+        )
         self._attr_name = "Renewable Share"
 
     @property
@@ -381,10 +554,9 @@ class EnergyChartsRenewableShareSensor(EnergyChartsBaseSensor):
         """Return the state of the sensor."""
         return self.coordinator.data.get("aggregated", {}).get(SENSOR_RENEWABLE_SHARE)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        attrs = super().extra_state_attributes
+    def _build_attributes(self) -> dict[str, Any]:
+        """Build the additional state attributes from the coordinator data."""
+        attrs = super()._build_attributes()
 
         renewable_mw = self.coordinator.data.get("aggregated", {}).get(
             SENSOR_TOTAL_RENEWABLE, 0
@@ -419,6 +591,10 @@ class EnergyChartsTotalFossilSensor(EnergyChartsBaseSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{DOMAIN}_{self._country}_{SENSOR_TOTAL_FOSSIL}"
+        self._listen_to(
+            ("aggregated", SENSOR_TOTAL_FOSSIL),
+            ("derived", "fossil_breakdown"),
+        )
         self._attr_name = "Fossil Production"
 
     @property
@@ -426,36 +602,15 @@ class EnergyChartsTotalFossilSensor(EnergyChartsBaseSensor):
         """Return the state of the sensor."""
         return self.coordinator.data.get("aggregated", {}).get(SENSOR_TOTAL_FOSSIL)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        attrs = super().extra_state_attributes
-
-        sources = self.coordinator.data.get("sources", {})
-
-        # Get individual fossil fuel types
-        coal_mw = sum(
-            data.get("value", 0)
-            for key, data in sources.items()
-            if "coal" in key and data.get("value", 0) > 0
-        )
-        gas_mw = sum(
-            data.get("value", 0)
-            for key, data in sources.items()
-            if "gas" in key and data.get("value", 0) > 0
-        )
-        oil_mw = sum(
-            data.get("value", 0)
-            for key, data in sources.items()
-            if "oil" in key and data.get("value", 0) > 0
-        )
+    def _build_attributes(self) -> dict[str, Any]:
+        """Build the additional state attributes from the coordinator data."""
+        attrs = super()._build_attributes()
 
+        # Individual fossil fuel types
         attrs.update(
-            {
-                "coal_mw": round(coal_mw, 2),
-                "gas_mw": round(gas_mw, 2),
-                "oil_mw": round(oil_mw, 2),
-            }
+            self.coordinator.data.get("derived", {}).get(
+                "fossil_breakdown", {"coal_mw": 0.0, "gas_mw": 0.0, "oil_mw": 0.0}
+            )
         )
 
         return attrs
@@ -477,6 +632,7 @@ class EnergyChartsTotalNuclearSensor(EnergyChartsBaseSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{DOMAIN}_{self._country}_{SENSOR_TOTAL_NUCLEAR}"
+        self._listen_to(("aggregated", SENSOR_TOTAL_NUCLEAR))
         self._attr_name = "Nuclear Production"
 
     @property
@@ -501,6 +657,10 @@ class EnergyChartsSolarTotalSensor(EnergyChartsBaseSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{DOMAIN}_{self._country}_{SENSOR_SOLAR_TOTAL}"
+        self._listen_to(
+            ("categories", SENSOR_SOLAR_TOTAL),
+            ("sources", "photovoltaic"),
+        )
         self._attr_name = "Solar Total"
 
     @property
@@ -508,10 +668,9 @@ class EnergyChartsSolarTotalSensor(EnergyChartsBaseSensor):
         """Return the state of the sensor."""
         return self.coordinator.data.get("categories", {}).get(SENSOR_SOLAR_TOTAL)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        attrs = super().extra_state_attributes
+    def _build_attributes(self) -> dict[str, Any]:
+        """Build the additional state attributes from the coordinator data."""
+        attrs = super()._build_attributes()
 
         sources = self.coordinator.data.get("sources", {})
         pv_mw = sources.get("photovoltaic", {}).get("value", 0) or 0
@@ -537,6 +696,11 @@ class EnergyChartsWindTotalSensor(EnergyChartsBaseSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{DOMAIN}_{self._country}_{SENSOR_WIND_TOTAL}"
+        self._listen_to(
+            ("categories", SENSOR_WIND_TOTAL),
+            ("sources", "wind_onshore"),
+            ("sources", "wind_offshore"),
+        )
         self._attr_name = "Wind Total"
 
     @property
@@ -544,10 +708,9 @@ class EnergyChartsWindTotalSensor(EnergyChartsBaseSensor):
         """Return the state of the sensor."""
         return self.coordinator.data.get("categories", {}).get(SENSOR_WIND_TOTAL)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        attrs = super().extra_state_attributes
+    def _build_attributes(self) -> dict[str, Any]:
+        """Build the additional state attributes from the coordinator data."""
+        attrs = super()._build_attributes()
 
         sources = self.coordinator.data.get("sources", {})
         onshore_mw = sources.get("wind_onshore", {}).get("value", 0) or 0
@@ -585,6 +748,12 @@ class EnergyChartsHydroTotalSensor(EnergyChartsBaseSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{DOMAIN}_{self._country}_{SENSOR_HYDRO_TOTAL}"
+        self._listen_to(
+            ("categories", SENSOR_HYDRO_TOTAL),
+            ("sources", "hydro_run-of-river"),
+            ("sources", "hydro_water_reservoir"),
+            ("sources", "hydro_pumped_storage"),
+        )
         self._attr_name = "Hydro Total"
 
     @property
@@ -592,10 +761,9 @@ class EnergyChartsHydroTotalSensor(EnergyChartsBaseSensor):
         """Return the state of the sensor."""
         return self.coordinator.data.get("categories", {}).get(SENSOR_HYDRO_TOTAL)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        attrs = super().extra_state_attributes
+    def _build_attributes(self) -> dict[str, Any]:
+        """Build the additional state attributes from the coordinator data."""
+        attrs = super()._build_attributes()
 
         sources = self.coordinator.data.get("sources", {})
         run_of_river = sources.get("hydro_run-of-river", {}).get("value", 0) or 0
@@ -629,9 +797,123 @@ class EnergyChartsFossilTotalSensor(EnergyChartsBaseSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{DOMAIN}_{self._country}_{SENSOR_FOSSIL_TOTAL}"
+        self._listen_to(("categories", SENSOR_FOSSIL_TOTAL))
         self._attr_name = "Fossil Total"
 
     @property
     def native_value(self) -> float | None:
         """Return the state of the sensor."""
         return self.coordinator.data.get("categories", {}).get(SENSOR_FOSSIL_TOTAL)
+
+
+@dataclass(frozen=True, kw_only=True)
+class EnergyChartsMetricSensorDescription(SensorEntityDescription):
+    """Description of a refresh metric sensor."""
+
+    value_fn: Callable[[EnergyChartsMetrics], float | int | None]
+
+
+def _round_ms(value: float | None) -> float | None:
+    """Round a latency for display."""
+    return None if value is None else round(value, 1)
+
+
+METRIC_SENSORS: tuple[EnergyChartsMetricSensorDescription, ...] = (
+    EnergyChartsMetricSensorDescription(
+        key="refresh_duration",
+        name="Refresh Duration",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:timer-outline",
+        value_fn=lambda metrics: _round_ms(metrics.last_ms(STAGE_REFRESH)),
+    ),
+    EnergyChartsMetricSensorDescription(
+        key="request_duration",
+        name="Request Duration",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:timer-outline",
+        value_fn=lambda metrics: _round_ms(metrics.last_ms(STAGE_REQUEST)),
+    ),
+    EnergyChartsMetricSensorDescription(
+        key="decode_duration",
+        name="Decode Duration",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:timer-outline",
+        value_fn=lambda metrics: _round_ms(metrics.last_ms(STAGE_DECODE)),
+    ),
+    EnergyChartsMetricSensorDescription(
+        key="process_duration",
+        name="Process Duration",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:timer-outline",
+        value_fn=lambda metrics: _round_ms(metrics.last_ms(STAGE_PROCESS)),
+    ),
+    EnergyChartsMetricSensorDescription(
+        key="payload_size",
+        name="Payload Size",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:download",
+        value_fn=lambda metrics: metrics.last_payload_bytes,
+    ),
+    EnergyChartsMetricSensorDescription(
+        key="request_retries",
+        name="Request Retries",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        icon="mdi:refresh",
+        value_fn=lambda metrics: metrics.retries,
+    ),
+    EnergyChartsMetricSensorDescription(
+        key="cache_hit_ratio",
+        name="Cache Hit Ratio",
+        native_unit_of_measurement=UNIT_PERCENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:cached",
+        value_fn=lambda metrics: (
+            None if (ratio := metrics.cache_hit_ratio) is None else round(ratio, 1)
+        ),
+    ),
+)
+
+
+class EnergyChartsMetricSensor(EnergyChartsBaseSensor):
+    """Diagnostic sensor exposing a refresh metric."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    entity_description: EnergyChartsMetricSensorDescription
+
+    def __init__(
+        self,
+        coordinator: EnergyChartsDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: EnergyChartsMetricSensorDescription,
+    ) -> None:
+        """Initialize the sensor.
+
+        Args:
+            coordinator: Data update coordinator
+            entry: Config entry
+            description: Metric sensor description
+
+        """
+        super().__init__(coordinator, entry)
+        self.entity_description = description
+        self._attr_unique_id = f"{DOMAIN}_{self._country}_{description.key}"
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self.coordinator.api_client.metrics)
+
+    def _build_attributes(self) -> dict[str, Any]:
+        """Return no attributes; metrics are detailed in the diagnostics."""
+        return {}
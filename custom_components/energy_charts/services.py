@@ -0,0 +1,250 @@
+"""Services for the Energy-Charts integration."""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_BUCKET,
+    ATTR_END,
+    ATTR_END_DATE,
+    ATTR_MAX_POINTS,
+    ATTR_MODE,
+    ATTR_SOURCE,
+    ATTR_START,
+    ATTR_START_DATE,
+    CONF_COUNTRY,
+    DOMAIN,
+    DOWNSAMPLE_BUCKETS,
+    DOWNSAMPLE_LTTB,
+    DOWNSAMPLE_MODES,
+    SERVICE_BACKFILL,
+    SERVICE_GET_SERIES,
+    SUPPORTED_COUNTRIES,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import EnergyChartsDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+BACKFILL_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_COUNTRY): vol.In(SUPPORTED_COUNTRIES),
+        vol.Required(ATTR_START_DATE): cv.date,
+        vol.Optional(ATTR_END_DATE): cv.date,
+    }
+)
+
+GET_SERIES_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_COUNTRY): vol.In(SUPPORTED_COUNTRIES),
+        vol.Required(ATTR_SOURCE): cv.string,
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_BUCKET): vol.All(
+            cv.time_period, vol.Range(min=timedelta(minutes=1))
+        ),
+        vol.Optional(ATTR_MAX_POINTS): vol.All(
+            vol.Coerce(int), vol.Range(min=3, max=10000)
+        ),
+        vol.Optional(ATTR_MODE, default=DOWNSAMPLE_LTTB): vol.In(DOWNSAMPLE_MODES),
+    }
+)
+
+
+async def _async_backfill(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Import historical data of a country into long-term statistics.
+
+    Args:
+        hass: Home Assistant instance
+        call: Service call
+
+    Raises:
+        HomeAssistantError: The date range is invalid or nothing was imported
+
+    """
+    # pylint: disable=import-outside-toplevel
+    from .api import EnergyChartsApiClient
+    from .backfill import EnergyChartsBackfill, async_get_rate_limiter
+    from .cache import async_get_response_cache
+    from .statistics import EnergyChartsStatisticsImporter
+
+    country: str = call.data[CONF_COUNTRY]
+    start: date = call.data[ATTR_START_DATE]
+    end: date = min(call.data.get(ATTR_END_DATE, date.max), dt_util.now().date())
+    if start > end:
+        raise HomeAssistantError(f"Start date {start} is after end date {end}")
+
+    api_client = EnergyChartsApiClient(
+        session=async_get_clientsession(hass),
+        country=country,
+        cache=async_get_response_cache(hass),
+    )
+    backfill = EnergyChartsBackfill(
+        api_client,
+        EnergyChartsStatisticsImporter(hass, country),
+        async_get_rate_limiter(hass),
+    )
+
+    imported, planned = await backfill.async_run(start, end)
+    _LOGGER.info(
+        "Backfilled %s from %s to %s: imported %d of %d files",
+        country,
+        start,
+        end,
+        imported,
+        planned,
+    )
+    if planned and not imported:
+        raise HomeAssistantError(f"No historical data could be fetched for {country}")
+
+
+def _get_coordinator(
+    hass: HomeAssistant, country: str
+) -> EnergyChartsDataUpdateCoordinator:
+    """Return the coordinator of a loaded entry for a country.
+
+    Raises:
+        HomeAssistantError: No loaded entry has data for the country
+
+    """
+    domain_data = hass.data.get(DOMAIN, {})
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.data.get(CONF_COUNTRY) != country:
+            continue
+        coordinator = domain_data.get(entry.entry_id)
+        if coordinator is not None and coordinator.data:
+            return coordinator
+    raise HomeAssistantError(f"No data loaded for {country}")
+
+
+def _timestamp_ms(value: datetime | None) -> int | None:
+    """Convert a service datetime, local time if naive, to Unix milliseconds."""
+    if value is None:
+        return None
+    return int(dt_util.as_timestamp(value) * 1000)
+
+
+@callback
+def _async_get_series(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Return a source or aggregate over a time range from memory.
+
+    Args:
+        hass: Home Assistant instance
+        call: Service call
+
+    Returns:
+        Points of the range, or min/max/mean per bucket if requested. With
+        max_points, the range is downsampled; without a range, the result
+        is shared with every other reader of the same refresh.
+
+    Raises:
+        HomeAssistantError: No data is loaded or the source is unknown
+
+    """
+    # pylint: disable=import-outside-toplevel
+    from .downsample import downsample
+    from .models import to_datetimes
+    from .query import bucket_range, find_series, slice_range
+    from .statistics import statistic_unit
+
+    country: str = call.data[CONF_COUNTRY]
+    source: str = call.data[ATTR_SOURCE].lower()
+    coordinator = _get_coordinator(hass, country)
+    data = coordinator.data
+
+    response = data["raw_response"]
+    values = find_series(response, data.get("aggregated_series"), source)
+    if values is None:
+        raise HomeAssistantError(f"Unknown source {source} for {country}")
+
+    start = call.data.get(ATTR_START)
+    end = call.data.get(ATTR_END)
+    timestamps, values = slice_range(
+        response.timestamps, values, _timestamp_ms(start), _timestamp_ms(end)
+    )
+
+    result: dict[str, Any] = {
+        CONF_COUNTRY: country,
+        ATTR_SOURCE: source,
+        "unit": statistic_unit(source),
+    }
+
+    mode = call.data[ATTR_MODE]
+    if (bucket := call.data.get(ATTR_BUCKET)) is not None:
+        mode = DOWNSAMPLE_BUCKETS
+        points = bucket_range(timestamps, values, int(bucket.total_seconds() * 1000))
+    elif (max_points := call.data.get(ATTR_MAX_POINTS)) is not None:
+        if start is None and end is None:
+            points = coordinator.downsampled(source, max_points, mode) or []
+        else:
+            points = downsample(timestamps, values, max_points, mode)
+    else:
+        mode = DOWNSAMPLE_LTTB
+        points = [
+            (timestamp, value)
+            for timestamp, value in zip(timestamps, values)
+            if value == value
+        ]
+
+    # Datetimes are built for the returned points only, all at once
+    datetimes = to_datetimes(int(point[0]) for point in points)
+    if mode == DOWNSAMPLE_BUCKETS:
+        result["buckets"] = [
+            {
+                "start": moment.isoformat(),
+                "min": round(low, 2),
+                "max": round(high, 2),
+                "mean": round(mean, 2),
+            }
+            for moment, (_, low, high, mean) in zip(datetimes, points)
+        ]
+    else:
+        result["points"] = [
+            [moment.isoformat(), round(value, 2)]
+            for moment, (_, value) in zip(datetimes, points)
+        ]
+    return result
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services.
+
+    Args:
+        hass: Home Assistant instance
+
+    """
+
+    async def async_backfill(call: ServiceCall) -> None:
+        await _async_backfill(hass, call)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_BACKFILL, async_backfill, schema=BACKFILL_SCHEMA
+    )
+
+    async def async_get_series(call: ServiceCall) -> ServiceResponse:
+        return _async_get_series(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SERIES,
+        async_get_series,
+        schema=GET_SERIES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,213 @@
+"""Long-term statistics import for Energy-Charts."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+import logging
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.core import HomeAssistant
+
+from .aggregation import AggregatedSeries
+from .const import (
+    DOMAIN,
+    SENSOR_RENEWABLE_SHARE,
+    STATISTICS_BATCH_SIZE,
+    UNIT_MEGAWATT,
+    UNIT_PERCENT,
+)
+from .models import EnergyChartsResponse, is_forecast_key, to_datetime
+
+_LOGGER = logging.getLogger(__name__)
+
+HOUR_MS = 3_600_000
+
+# Quarter-hour points that make up a complete hour
+POINTS_PER_HOUR = 4
+
+# Series to import: key -> (name, unit, timestamps, values)
+StatisticsSource = tuple[str, str, array, array]
+
+
+def statistic_id(country: str, key: str) -> str:
+    """Return the external statistic ID of a series."""
+    return f"{DOMAIN}:{country}_{key}".lower()
+
+
+def statistic_unit(key: str) -> str:
+    """Return the unit of a series by key.
+
+    Share series, e.g. renewable_share or renewable_share_of_load, are
+    percentages; every other series is power in MW.
+    """
+    if key == SENSOR_RENEWABLE_SHARE or "_share" in key:
+        return UNIT_PERCENT
+    return UNIT_MEGAWATT
+
+
+def hourly_statistics(
+    timestamps: array[int], values: array[float], after_ms: int | None
+) -> list[StatisticData]:
+    """Aggregate quarter-hour values into hourly mean/min/max rows.
+
+    Only hours after after_ms are returned. The hour of the latest value is
+    only returned once it is complete, so a partial hour is never imported.
+
+    Args:
+        timestamps: Unix timestamps in milliseconds
+        values: Values aligned with the timestamps, NaN for missing values
+        after_ms: Start of the last imported hour, or None
+
+    Returns:
+        Hourly statistic rows in chronological order
+
+    """
+    length = min(len(timestamps), len(values))
+    start = 0
+    if after_ms is not None:
+        start = bisect_left(timestamps, after_ms + HOUR_MS, 0, length)
+
+    rows: list[StatisticData] = []
+    hour: int | None = None
+    bucket: list[float] = []
+
+    def flush() -> None:
+        if hour is not None and bucket:
+            rows.append(
+                StatisticData(
+                    start=to_datetime(hour),
+                    mean=sum(bucket) / len(bucket),
+                    min=min(bucket),
+                    max=max(bucket),
+                )
+            )
+
+    for index in range(start, length):
+        value = values[index]
+        if value != value:
+            continue
+        value_hour = timestamps[index] - timestamps[index] % HOUR_MS
+        if value_hour != hour:
+            flush()
+            hour = value_hour
+            bucket = []
+        bucket.append(value)
+
+    # The latest hour may still receive values
+    if len(bucket) >= POINTS_PER_HOUR:
+        flush()
+
+    return rows
+
+
+def statistics_sources(
+    response: EnergyChartsResponse, aggregated_series: AggregatedSeries
+) -> dict[str, StatisticsSource]:
+    """Collect the source and aggregate series of a response to import.
+
+    Args:
+        response: Parsed response
+        aggregated_series: Aggregates computed from the response
+
+    Returns:
+        Series to import by key
+
+    """
+    sources: dict[str, StatisticsSource] = {
+        series.key.lower(): (
+            series.name_en,
+            statistic_unit(series.key.lower()),
+            series.timestamps,
+            series.data,
+        )
+        for series in response.data_series
+        if not is_forecast_key(series.key)
+    }
+
+    for key, values in aggregated_series.values.items():
+        sources[key] = (
+            key.replace("_", " ").title(),
+            statistic_unit(key),
+            aggregated_series.timestamps,
+            values,
+        )
+
+    return sources
+
+
+class EnergyChartsStatisticsImporter:
+    """Import series of one country as external long-term statistics.
+
+    The start of the last imported hour is remembered per statistic, so
+    each refresh only adds the hours that completed since the last one.
+    """
+
+    def __init__(self, hass: HomeAssistant, country: str) -> None:
+        """Initialize the importer.
+
+        Args:
+            hass: Home Assistant instance
+            country: Country code
+
+        """
+        self._hass = hass
+        self._country = country
+        self._last_imported: dict[str, int | None] = {}
+
+    async def _async_last_imported(self, stat_id: str) -> int | None:
+        """Return the start of the last imported hour of a statistic."""
+        if stat_id in self._last_imported:
+            return self._last_imported[stat_id]
+
+        last = await get_instance(self._hass).async_add_executor_job(
+            get_last_statistics, self._hass, 1, stat_id, True, {"start"}
+        )
+        start = None
+        if rows := last.get(stat_id):
+            start = int(rows[0]["start"] * 1000)
+        self._last_imported[stat_id] = start
+        return start
+
+    async def async_import(
+        self, sources: Mapping[str, StatisticsSource], incremental: bool = True
+    ) -> None:
+        """Import the new complete hours of each series.
+
+        Args:
+            sources: Series to import by key
+            incremental: Skip hours up to the last imported one; disable to
+                (re)import historical data, which overwrites existing hours
+
+        """
+        for key, (name, unit, timestamps, values) in sources.items():
+            stat_id = statistic_id(self._country, key)
+            after = await self._async_last_imported(stat_id) if incremental else None
+            rows = hourly_statistics(timestamps, values, after)
+            if not rows:
+                continue
+
+            metadata = StatisticMetaData(
+                has_mean=True,
+                has_sum=False,
+                name=f"Energy Charts {self._country.upper()} {name}",
+                source=DOMAIN,
+                statistic_id=stat_id,
+                unit_of_measurement=unit,
+            )
+            for batch_start in range(0, len(rows), STATISTICS_BATCH_SIZE):
+                async_add_external_statistics(
+                    self._hass,
+                    metadata,
+                    rows[batch_start : batch_start + STATISTICS_BATCH_SIZE],
+                )
+
+            last = int(rows[-1]["start"].timestamp() * 1000)
+            if incremental or last > (self._last_imported.get(stat_id) or 0):
+                self._last_imported[stat_id] = last
+            _LOGGER.debug("Imported %d hourly statistics for %s", len(rows), stat_id)
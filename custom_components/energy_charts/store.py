@@ -0,0 +1,139 @@
+"""Persistent response store for Energy-Charts."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DATA_RESPONSE_STORE,
+    DOMAIN,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .models import EnergyChartsResponse
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EnergyChartsResponseStore:
+    """Keep the last good response per country and endpoint on disk.
+
+    The snapshot lets entries populate their sensors immediately after a
+    restart while the network refresh runs in the background.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store.
+
+        Args:
+            hass: Home Assistant instance
+
+        """
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._data: dict[str, dict[str, Any]] | None = None
+        self._saved: dict[tuple[str, str], EnergyChartsResponse] = {}
+        self._load_lock = asyncio.Lock()
+
+    async def async_load(self) -> None:
+        """Load the snapshot from disk once."""
+        async with self._load_lock:
+            if self._data is not None:
+                return
+            try:
+                self._data = await self._store.async_load() or {}
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.warning("Failed to load stored responses: %s", err)
+                self._data = {}
+
+    async def async_get_responses(
+        self, country: str, endpoints: list[str]
+    ) -> dict[str, EnergyChartsResponse]:
+        """Return the stored responses for the given endpoints.
+
+        Args:
+            country: Country code
+            endpoints: Endpoint file names to look up
+
+        Returns:
+            Mapping of endpoint to parsed response for stored endpoints
+
+        """
+        await self.async_load()
+        assert self._data is not None
+
+        stored = self._data.get(country, {})
+        responses: dict[str, EnergyChartsResponse] = {}
+        for endpoint in endpoints:
+            if (compact := stored.get(endpoint)) is None:
+                continue
+            try:
+                response = EnergyChartsResponse.from_compact(compact)
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.warning(
+                    "Ignoring invalid stored response %s/%s: %s",
+                    country,
+                    endpoint,
+                    err,
+                )
+                continue
+            responses[endpoint] = response
+            self._saved[(country, endpoint)] = response
+        return responses
+
+    @callback
+    def async_save_responses(
+        self, country: str, responses: dict[str, EnergyChartsResponse]
+    ) -> None:
+        """Replace the stored responses of a country and schedule a save.
+
+        Nothing is written when every response is the same object that was
+        saved or restored before, e.g. after a 304 Not Modified.
+
+        Args:
+            country: Country code
+            responses: Mapping of endpoint to parsed response
+
+        """
+        if self._data is None:
+            return
+
+        changed = set(responses) != set(self._data.get(country, {})) or any(
+            self._saved.get((country, endpoint)) is not response
+            for endpoint, response in responses.items()
+        )
+        if not changed:
+            return
+
+        self._data[country] = {
+            endpoint: response.to_compact()
+            for endpoint, response in responses.items()
+        }
+        for key in [key for key in self._saved if key[0] == country]:
+            del self._saved[key]
+        for endpoint, response in responses.items():
+            self._saved[(country, endpoint)] = response
+
+        self._store.async_delay_save(lambda: self._data or {}, STORAGE_SAVE_DELAY)
+
+
+def async_get_response_store(hass: HomeAssistant) -> EnergyChartsResponseStore:
+    """Return the response store shared by all entries.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Shared response store stored in hass.data
+
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (store := domain_data.get(DATA_RESPONSE_STORE)) is None:
+        store = domain_data[DATA_RESPONSE_STORE] = EnergyChartsResponseStore(hass)
+    return store
@@ -0,0 +1,126 @@
+"""Rolling data window across Energy-Charts week files."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from datetime import date, timedelta
+
+from .models import NAN, EnergyChartsResponse, EnergyDataSeries
+
+
+def week_endpoint(day: date) -> str:
+    """Return the week file containing a day."""
+    year, week, _ = day.isocalendar()
+    return f"week_{year}_{week:02d}.json"
+
+
+def adjacent_week_endpoint(endpoint: str, weeks: int) -> str:
+    """Return the week file a number of weeks before or after another.
+
+    Args:
+        endpoint: Week file name, e.g. "week_2024_01.json"
+        weeks: Number of weeks to move, negative to move back
+
+    Returns:
+        Week file name
+
+    """
+    _, year, week = endpoint.removesuffix(".json").split("_")
+    monday = date.fromisocalendar(int(year), int(week), 1)
+    return week_endpoint(monday + timedelta(weeks=weeks))
+
+
+class RollingWindow:
+    """Parsed week files kept in memory across refreshes.
+
+    Keeping the previous week's file lets the coordinator stitch a window
+    that reaches back over the week boundary without downloading it again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty window."""
+        self._files: dict[str, EnergyChartsResponse] = {}
+
+    def __contains__(self, endpoint: object) -> bool:
+        """Return whether a week file is held."""
+        return endpoint in self._files
+
+    @property
+    def files(self) -> dict[str, EnergyChartsResponse]:
+        """Return the held week files by endpoint."""
+        return dict(self._files)
+
+    def get(self, endpoint: str) -> EnergyChartsResponse | None:
+        """Return a held week file."""
+        return self._files.get(endpoint)
+
+    def set(self, endpoint: str, response: EnergyChartsResponse) -> None:
+        """Hold the latest version of a week file."""
+        self._files[endpoint] = response
+
+    def retain(self, endpoints: Iterable[str]) -> None:
+        """Drop every week file not in endpoints."""
+        keep = set(endpoints)
+        for endpoint in [endpoint for endpoint in self._files if endpoint not in keep]:
+            del self._files[endpoint]
+
+
+def stitch(responses: Sequence[EnergyChartsResponse]) -> EnergyChartsResponse:
+    """Concatenate consecutive files into one time-sorted response.
+
+    Where files overlap, the points of the later file win, so every
+    timestamp appears once. Series missing from a file are filled with
+    NaN for its timestamps; names and colors come from the latest file
+    containing the series.
+
+    Args:
+        responses: Responses of consecutive files, oldest first
+
+    Returns:
+        Stitched response; a single response is returned unchanged
+
+    """
+    if len(responses) == 1:
+        return responses[0]
+
+    # Cut every file where the next one starts
+    limits: list[int] = []
+    for index, response in enumerate(responses):
+        limit = len(response.timestamps)
+        for later in responses[index + 1 :]:
+            if later.timestamps:
+                limit = bisect_left(response.timestamps, later.timestamps[0], 0, limit)
+                break
+        limits.append(limit)
+
+    timestamps = array("q")
+    for response, limit in zip(responses, limits):
+        timestamps.extend(response.timestamps[:limit])
+
+    latest: dict[str, EnergyDataSeries] = {}
+    for response in responses:
+        for series in response.data_series:
+            latest[series.key] = series
+
+    data_series = []
+    for key, template in latest.items():
+        data = array("d")
+        for response, limit in zip(responses, limits):
+            series = response.get_series_by_key(key)
+            values = series.data[:limit] if series is not None else array("d")
+            data.extend(values)
+            if len(values) < limit:
+                data.extend(array("d", [NAN]) * (limit - len(values)))
+        data_series.append(
+            EnergyDataSeries(
+                name=template.name,
+                color=template.color,
+                data=data,
+                timestamps=timestamps,
+                visible=template.visible,
+            )
+        )
+
+    return EnergyChartsResponse(data_series=data_series, timestamps=timestamps)
+
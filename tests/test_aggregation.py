@@ -0,0 +1,80 @@
+"""Tests for the aggregation of series over full time ranges."""
+from __future__ import annotations
+
+from array import array
+import math
+
+from custom_components.energy_charts.aggregation import aggregate_series
+from custom_components.energy_charts.const import (
+    SENSOR_RENEWABLE_SHARE,
+    SENSOR_TOTAL_PRODUCTION,
+)
+from custom_components.energy_charts.delta import first_changed_index
+from custom_components.energy_charts.models import EnergyChartsResponse
+
+QUARTER_HOUR_MS = 900_000
+
+
+def _response(published: int, points: int = 96) -> EnergyChartsResponse:
+    """Return solar and gas series with the first points published."""
+    timestamps = [index * QUARTER_HOUR_MS for index in range(points)]
+
+    def data(offset: float) -> list[float | None]:
+        return [
+            offset + index if index < published else None for index in range(points)
+        ]
+
+    return EnergyChartsResponse.from_api_response(
+        [
+            {
+                "xAxisValues": timestamps,
+                "name": [{"en": "Solar"}],
+                "data": data(100.0),
+            },
+            {"name": [{"en": "Fossil gas"}], "data": data(50.0)},
+        ]
+    )
+
+
+def _same(left: array, right: array) -> bool:
+    """Return whether two float arrays are equal, NaN included."""
+    return left.tobytes() == right.tobytes()
+
+
+def test_extending_from_the_changed_tail_matches_a_full_rebuild() -> None:
+    """Aggregates extended from the first changed index equal a rebuild."""
+    before = _response(published=40)
+    after = _response(published=44)
+    previous = aggregate_series(before.data_series, before.timestamps)
+    start = min(
+        first_changed_index(old.data, new.data)
+        for old, new in zip(before.data_series, after.data_series)
+    )
+
+    extended = aggregate_series(
+        after.data_series, after.timestamps, previous=previous, start=start
+    )
+    rebuilt = aggregate_series(after.data_series, after.timestamps)
+
+    assert start == 40
+    assert extended.values.keys() == rebuilt.values.keys()
+    for key, values in rebuilt.values.items():
+        assert _same(extended.values[key], values), key
+    assert extended.values[SENSOR_TOTAL_PRODUCTION][43] == 150.0 + 2 * 43
+    assert math.isnan(extended.values[SENSOR_TOTAL_PRODUCTION][44])
+
+
+def test_start_beyond_the_previous_aggregates_rebuilds() -> None:
+    """A start the previous aggregates do not reach falls back to a rebuild."""
+    before = _response(published=10, points=20)
+    after = _response(published=44)
+    previous = aggregate_series(before.data_series, before.timestamps)
+
+    extended = aggregate_series(
+        after.data_series, after.timestamps, previous=previous, start=40
+    )
+    rebuilt = aggregate_series(after.data_series, after.timestamps)
+
+    assert _same(
+        extended.values[SENSOR_RENEWABLE_SHARE], rebuilt.values[SENSOR_RENEWABLE_SHARE]
+    )
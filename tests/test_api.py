@@ -0,0 +1,39 @@
+"""Tests for the Energy-Charts API client."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from custom_components.energy_charts.api import EnergyChartsApiClient
+from custom_components.energy_charts.cache import EnergyChartsResponseCache
+
+
+async def _fetch_concurrently(use_cache: tuple[bool, bool]) -> int:
+    """Fetch one endpoint twice at once and return the number of requests."""
+    client = EnergyChartsApiClient(MagicMock(), "de", EnergyChartsResponseCache())
+    requests = 0
+
+    async def request(*args: object) -> object:
+        nonlocal requests
+        requests += 1
+        await asyncio.sleep(0)
+        return object()
+
+    with patch.object(client, "_async_request", request):
+        await asyncio.gather(
+            *(
+                client.get_endpoint("week_2025_10.json", use_cache=flag)
+                for flag in use_cache
+            )
+        )
+    return requests
+
+
+def test_identical_requests_share_one_flight() -> None:
+    """Concurrent identical requests are sent once."""
+    assert asyncio.run(_fetch_concurrently((True, True))) == 1
+
+
+def test_cached_request_does_not_join_uncached_flight() -> None:
+    """A request updating the cache does not join one bypassing it."""
+    assert asyncio.run(_fetch_concurrently((False, True))) == 2
@@ -0,0 +1,60 @@
+"""Tests for the historical backfill."""
+from __future__ import annotations
+
+from array import array
+from datetime import date
+from unittest.mock import MagicMock
+
+from custom_components.energy_charts.backfill import (
+    async_get_rate_limiter,
+    clip_sources,
+    plan_backfill,
+)
+
+HOUR_MS = 3_600_000
+
+
+def test_month_file_replaces_two_or_more_week_files() -> None:
+    """A month file is planned as soon as it saves files."""
+    assert plan_backfill(date(2025, 3, 1), date(2025, 3, 20)) == [
+        "month_2025_03.json"
+    ]
+    assert plan_backfill(date(2025, 3, 3), date(2025, 3, 9)) == ["week_2025_10.json"]
+
+
+def test_week_files_shared_by_months_are_planned_once() -> None:
+    """A week spanning two months is not planned twice."""
+    assert plan_backfill(date(2025, 3, 29), date(2025, 4, 3)) == [
+        "week_2025_13.json",
+        "week_2025_14.json",
+    ]
+    assert plan_backfill(date(2025, 3, 1), date(2025, 4, 30)) == [
+        "month_2025_03.json",
+        "month_2025_04.json",
+    ]
+
+
+def test_clip_sources_drops_points_outside_the_range() -> None:
+    """Only points within the range are kept."""
+    timestamps = array("q", [index * HOUR_MS for index in range(6)])
+    values = array("d", [float(index) for index in range(6)])
+
+    clipped = clip_sources(
+        {"solar": ("Solar", "MW", timestamps, values)}, 2 * HOUR_MS, 4 * HOUR_MS - 1
+    )
+
+    name, unit, clipped_timestamps, clipped_values = clipped["solar"]
+    assert (name, unit) == ("Solar", "MW")
+    assert list(clipped_timestamps) == [2 * HOUR_MS, 3 * HOUR_MS]
+    assert list(clipped_values) == [2.0, 3.0]
+
+
+def test_rate_limiter_is_shared_per_host() -> None:
+    """All backfills to a host share one rate limiter."""
+    hass = MagicMock()
+    hass.data = {}
+
+    limiter = async_get_rate_limiter(hass)
+
+    assert async_get_rate_limiter(hass) is limiter
+    assert async_get_rate_limiter(hass, "https://example.com/data") is not limiter
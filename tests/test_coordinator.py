@@ -0,0 +1,111 @@
+"""Tests for the Energy-Charts data update coordinator."""
+from __future__ import annotations
+
+import asyncio
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.energy_charts.aggregation import aggregate_series
+from custom_components.energy_charts.api import EnergyChartsNotFoundError
+from custom_components.energy_charts.const import CONF_COUNTRY, CONF_HISTORICAL_RANGE
+from custom_components.energy_charts.coordinator import (
+    FETCH_CURRENT,
+    FETCH_NEXT,
+    EnergyChartsDataUpdateCoordinator,
+)
+from custom_components.energy_charts.models import EnergyChartsResponse
+from custom_components.energy_charts.window import week_endpoint
+
+DAY_MS = 86_400_000
+QUARTER_HOUR_MS = 900_000
+
+MONDAY = date(2025, 3, 10)
+CURRENT = week_endpoint(MONDAY)
+NEXT = week_endpoint(MONDAY + timedelta(weeks=1))
+
+
+def _week_response(monday: date, points: int) -> EnergyChartsResponse:
+    """Return a solar series over the first quarter-hours of a week."""
+    start_ms = (monday - date(1970, 1, 1)).days * DAY_MS
+    return EnergyChartsResponse.from_api_response(
+        [
+            {
+                "xAxisValues": [
+                    start_ms + index * QUARTER_HOUR_MS for index in range(points)
+                ],
+                "name": [{"en": "Solar"}],
+                "data": [100.0 + index for index in range(points)],
+            }
+        ]
+    )
+
+
+def _coordinator() -> EnergyChartsDataUpdateCoordinator:
+    """Return a coordinator with mocked Home Assistant, client and store."""
+    entry = MagicMock()
+    entry.data = {CONF_COUNTRY: "de", CONF_HISTORICAL_RANGE: "none"}
+    entry.options = {}
+    coordinator = EnergyChartsDataUpdateCoordinator(
+        MagicMock(), entry, MagicMock(), MagicMock()
+    )
+    coordinator._statistics = MagicMock()
+    return coordinator
+
+
+def test_held_prefetch_stands_in_for_failed_current_week() -> None:
+    """A failed fetch of the new week falls back to its prefetched version."""
+    coordinator = _coordinator()
+    prefetched = _week_response(MONDAY + timedelta(weeks=1), 4)
+
+    # Shortly before the boundary, the next week is prefetched
+    with patch.object(
+        coordinator,
+        "_plan_fetch",
+        return_value={FETCH_CURRENT: CURRENT, FETCH_NEXT: NEXT},
+    ), patch.object(
+        coordinator,
+        "_fetch_planned",
+        AsyncMock(
+            return_value={CURRENT: _week_response(MONDAY, 672), NEXT: prefetched}
+        ),
+    ):
+        coordinator.data = asyncio.run(coordinator._async_fetch_data())
+
+    # Right after it, the new current week is not published yet
+    with patch.object(
+        coordinator, "_plan_fetch", return_value={FETCH_CURRENT: NEXT}
+    ), patch.object(
+        coordinator,
+        "_fetch_planned",
+        AsyncMock(return_value={NEXT: EnergyChartsNotFoundError(NEXT)}),
+    ):
+        data = asyncio.run(coordinator._async_fetch_data())
+
+    assert data["raw_response"] is prefetched
+    assert data["sources"]["solar"]["value"] == 103.0
+
+
+def test_aggregates_are_extended_from_new_points() -> None:
+    """Aggregates of a refresh with new points equal a full rebuild."""
+    coordinator = _coordinator()
+
+    for points in (40, 44):
+        with patch.object(
+            coordinator, "_plan_fetch", return_value={FETCH_CURRENT: CURRENT}
+        ), patch.object(
+            coordinator,
+            "_fetch_planned",
+            AsyncMock(return_value={CURRENT: _week_response(MONDAY, points)}),
+        ), patch(
+            "custom_components.energy_charts.coordinator.aggregate_series",
+            wraps=aggregate_series,
+        ) as aggregate:
+            coordinator.data = asyncio.run(coordinator._async_fetch_data())
+
+    assert aggregate.call_args.kwargs["start"] == 40
+    response = coordinator.data["raw_response"]
+    rebuilt = aggregate_series(response.data_series, response.timestamps)
+    for key, values in rebuilt.values.items():
+        assert coordinator.data["aggregated_series"].get(key).tobytes() == (
+            values.tobytes()
+        ), key
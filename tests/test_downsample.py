@@ -0,0 +1,51 @@
+"""Tests for downsampling series for charts."""
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from custom_components.energy_charts.downsample import bucket_series, lttb
+
+QUARTER_HOUR_MS = 900_000
+
+
+def _series(start: datetime, points: int) -> tuple[list[int], list[float]]:
+    """Return quarter-hourly timestamps from a start and distinct values."""
+    start_ms = int(start.timestamp() * 1000)
+    timestamps = [start_ms + index * QUARTER_HOUR_MS for index in range(points)]
+    return timestamps, [float(index % 7) for index in range(points)]
+
+
+def test_buckets_do_not_exceed_threshold_off_boundary() -> None:
+    """A start off the bucket boundary does not add a bucket."""
+    timestamps, values = _series(datetime(2025, 3, 1, 1, 15, tzinfo=UTC), 96)
+
+    buckets = bucket_series(timestamps, values, 24)
+
+    assert len(buckets) == 24
+    assert buckets[0][0] == timestamps[0]
+    assert all(
+        later[0] - earlier[0] == 4 * QUARTER_HOUR_MS
+        for earlier, later in zip(buckets, buckets[1:])
+    )
+
+
+def test_buckets_never_exceed_threshold() -> None:
+    """No combination of start, length and threshold exceeds the threshold."""
+    for minute in (0, 15, 30, 45):
+        for points in (1, 5, 96, 97, 673):
+            timestamps, values = _series(
+                datetime(2025, 3, 1, 1, minute, tzinfo=UTC), points
+            )
+            for threshold in (1, 7, 24, 100):
+                assert len(bucket_series(timestamps, values, threshold)) <= threshold
+
+
+def test_lttb_keeps_endpoints_within_threshold() -> None:
+    """LTTB returns at most threshold points including both ends."""
+    timestamps, values = _series(datetime(2025, 3, 1, 1, 15, tzinfo=UTC), 96)
+
+    sampled = lttb(timestamps, values, 24)
+
+    assert len(sampled) == 24
+    assert sampled[0] == (timestamps[0], values[0])
+    assert sampled[-1] == (timestamps[-1], values[-1])
@@ -0,0 +1,68 @@
+"""Tests for the publication-aware polling schedule."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from custom_components.energy_charts.polling import AdaptivePollSchedule
+
+MINUTE_MS = 60_000
+QUARTER_HOUR_MS = 15 * MINUTE_MS
+LAG_MS = 3 * MINUTE_MS
+
+
+def _simulate(
+    schedule: AdaptivePollSchedule, hours: int, lag_ms: int = LAG_MS
+) -> list[tuple[int, int | None]]:
+    """Poll a source publishing each quarter-hour a lag after it ended.
+
+    Returns:
+        (poll time, newest published point) per poll
+
+    """
+    now_ms = 0
+    polls = []
+    while now_ms < hours * 3_600_000:
+        published = now_ms - QUARTER_HOUR_MS - lag_ms
+        latest_ms = published - published % QUARTER_HOUR_MS if published >= 0 else None
+        polls.append((now_ms, latest_ms))
+        interval = schedule.next_interval(latest_ms, now_ms)
+        now_ms += int(interval.total_seconds() * 1000)
+    return polls
+
+
+def test_steady_state_polls_once_per_publication() -> None:
+    """A short configured interval does not add polls between publications."""
+    polls = _simulate(AdaptivePollSchedule(timedelta(minutes=5)), hours=24)
+
+    last_hours = [poll for poll in polls if poll[0] >= 20 * 3_600_000]
+    assert len(last_hours) <= 4 * 4 + 1
+    # Every steady-state poll sees a new point
+    latest = [latest_ms for _, latest_ms in last_hours]
+    assert len(set(latest)) == len(latest)
+
+
+def test_steady_state_polls_shortly_after_publication() -> None:
+    """Polls follow the publication within the lag precision and margin."""
+    polls = _simulate(AdaptivePollSchedule(timedelta(minutes=5)), hours=24)
+
+    for now_ms, latest_ms in polls:
+        if now_ms >= 20 * 3_600_000:
+            published_ms = latest_ms + QUARTER_HOUR_MS + LAG_MS
+            assert now_ms - published_ms <= 2 * MINUTE_MS
+
+
+def test_overdue_points_back_off_up_to_the_configured_interval() -> None:
+    """Retries for a late point grow from the minimum to the configured interval."""
+    schedule = AdaptivePollSchedule(timedelta(minutes=5))
+    now_ms, latest_ms = _simulate(schedule, hours=6)[-1]
+
+    # Publication stops
+    intervals = []
+    for _ in range(8):
+        interval = schedule.next_interval(latest_ms, now_ms)
+        intervals.append(interval)
+        now_ms += int(interval.total_seconds() * 1000)
+
+    retries = intervals[1:]
+    assert retries[:3] == [timedelta(minutes=minutes) for minutes in (1, 2, 4)]
+    assert retries[-1] == timedelta(minutes=5)
@@ -0,0 +1,57 @@
+"""Tests for the long-term statistics import."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from custom_components.energy_charts.aggregation import aggregate_series
+from custom_components.energy_charts.const import UNIT_MEGAWATT, UNIT_PERCENT
+from custom_components.energy_charts.models import EnergyChartsResponse
+from custom_components.energy_charts.statistics import (
+    EnergyChartsStatisticsImporter,
+    statistics_sources,
+)
+
+HOUR_MS = 3_600_000
+QUARTER_HOUR_MS = 900_000
+
+
+def _response() -> EnergyChartsResponse:
+    """Return two complete hours of a solar and a share series."""
+    timestamps = [HOUR_MS * 1000 + index * QUARTER_HOUR_MS for index in range(8)]
+    return EnergyChartsResponse.from_api_response(
+        [
+            {
+                "xAxisValues": timestamps,
+                "name": [{"en": "Solar"}],
+                "data": [1000.0] * 8,
+            },
+            {
+                "name": [{"en": "Renewable share of load"}],
+                "data": [55.0] * 8,
+            },
+        ]
+    )
+
+
+def test_share_series_are_imported_as_percentages() -> None:
+    """Share series get a percentage unit, power series MW."""
+    response = _response()
+    sources = statistics_sources(
+        response, aggregate_series(response.data_series, response.timestamps)
+    )
+    importer = EnergyChartsStatisticsImporter(MagicMock(), "de")
+
+    with patch(
+        "custom_components.energy_charts.statistics.async_add_external_statistics"
+    ) as add_statistics:
+        asyncio.run(importer.async_import(sources, incremental=False))
+
+    units = {
+        call.args[1]["statistic_id"]: call.args[1]["unit_of_measurement"]
+        for call in add_statistics.call_args_list
+    }
+    assert units["energy_charts:de_renewable_share_of_load"] == UNIT_PERCENT
+    assert units["energy_charts:de_renewable_share"] == UNIT_PERCENT
+    assert units["energy_charts:de_solar"] == UNIT_MEGAWATT
+    assert units["energy_charts:de_total_production"] == UNIT_MEGAWATT